@@ -1,14 +1,30 @@
-import os
 from typing import Optional
-from fastapi import FastAPI, HTTPException, status
+import orjson
+from fastapi import FastAPI, HTTPException, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from mangum import Mangum
 from aws_lambda_powertools import Logger
 
-from .models.item import ItemCreate, ItemUpdate, Item, ItemResponse, ItemListResponse
+try:
+    # Install uvloop before Mangum creates its event loop; optional on platforms without it
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+from .models.item import (
+    ItemCreate,
+    ItemUpdate,
+    ItemBatchCreate,
+    ItemBatchGet,
+    Item,
+    ItemResponse,
+    ItemListResponse,
+)
 from .utils.dynamodb import DynamoDBClient
 from .utils.metrics import MetricsCollector
+from .utils.middleware import ErrorMiddleware, HealthCheckMiddleware
 
 # Initialize logger
 logger = Logger()
@@ -18,8 +34,27 @@ app = FastAPI(
     title="Multi-Runtime API Benchmark - Python",
     description="Python Lambda implementation using FastAPI and Mangum",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
+HEALTH_PAYLOAD = {
+    "status": "healthy",
+    "runtime": "python",
+    "version": "3.11",
+    "framework": "FastAPI + Mangum",
+}
+
+# Answer health probes before FastAPI routing runs; innermost so CORS still applies
+app.add_middleware(
+    HealthCheckMiddleware,
+    paths=("/health", "/python/health"),
+    payload=HEALTH_PAYLOAD,
+)
+
+# Turn unhandled exceptions into JSON 500s without building Request/Response objects.
+# Registered before CORS so error responses still carry CORS headers.
+app.add_middleware(ErrorMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -33,18 +68,51 @@ app.add_middleware(
 db_client = DynamoDBClient()
 metrics_collector = MetricsCollector()
 
+# pydantic-core's Rust serializer, bypassing jsonable_encoder and json.dumps
+_serialize_item = Item.__pydantic_serializer__.to_json
+
+
+# Fixed parts of the success envelope, encoded once at import
+_SUCCESS_PREFIX = b'{"success":true,"data":'
+_COUNT_KEY = b',"count":'
+
+
+def _message_suffix(message: str) -> bytes:
+    """Pre-encode the closing message part of the success envelope"""
+    return b',"message":' + orjson.dumps(message) + b'}'
+
+
+_ITEM_CREATED = _message_suffix("Item created successfully")
+_ITEM_RETRIEVED = _message_suffix("Item retrieved successfully")
+_ITEMS_CREATED = _message_suffix("Items created successfully")
+_ITEMS_RETRIEVED = _message_suffix("Items retrieved successfully")
+
+
+def _success_response(
+    data: bytes,
+    suffix: bytes,
+    status_code: int = status.HTTP_200_OK,
+    count: Optional[int] = None,
+) -> Response:
+    """Splice pre-serialized JSON data into the standard success envelope"""
+    if count is None:
+        body = b''.join((_SUCCESS_PREFIX, data, suffix))
+    else:
+        body = b''.join((_SUCCESS_PREFIX, data, _COUNT_KEY, str(count).encode(), suffix))
+    return Response(content=body, media_type="application/json", status_code=status_code)
+
+
+def _serialize_items(items: list[Item]) -> bytes:
+    """Serialize a list of items to a JSON array"""
+    return b'[' + b','.join([_serialize_item(item) for item in items]) + b']'
+
 
 # Health check endpoint
 @app.get("/health")
 @app.get("/python/health")
 async def health_check():
-    """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "runtime": "python",
-        "version": "3.11",
-        "framework": "FastAPI + Mangum",
-    }
+    """Health check endpoint (served by HealthCheckMiddleware; kept for OpenAPI)"""
+    return HEALTH_PAYLOAD
 
 
 # Metrics endpoint
@@ -67,16 +135,19 @@ async def get_metrics():
 
 
 # Create item
-@app.post("/items", response_model=ItemResponse, status_code=status.HTTP_201_CREATED)
-@app.post("/python/items", response_model=ItemResponse, status_code=status.HTTP_201_CREATED)
+# Hot read/create paths skip response_model re-validation; the schema is kept for OpenAPI only
+@app.post(
+    "/items", status_code=status.HTTP_201_CREATED, responses={201: {"model": ItemResponse}}
+)
+@app.post(
+    "/python/items", status_code=status.HTTP_201_CREATED, responses={201: {"model": ItemResponse}}
+)
 async def create_item(item_data: ItemCreate):
     """Create a new item"""
     try:
         item = db_client.create_item(item_data)
-        return ItemResponse(
-            success=True,
-            data=item,
-            message="Item created successfully"
+        return _success_response(
+            _serialize_item(item), _ITEM_CREATED, status.HTTP_201_CREATED
         )
     except Exception as e:
         logger.error(f"Error creating item: {e}")
@@ -86,9 +157,56 @@ async def create_item(item_data: ItemCreate):
         )
 
 
+# Create items in batch
+@app.post(
+    "/items:batch",
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": ItemListResponse}},
+)
+@app.post(
+    "/python/items:batch",
+    status_code=status.HTTP_201_CREATED,
+    responses={201: {"model": ItemListResponse}},
+)
+async def create_items_batch(batch_data: ItemBatchCreate):
+    """Create several items in one request"""
+    try:
+        items = db_client.create_items_batch(batch_data.items)
+        return _success_response(
+            _serialize_items(items),
+            _ITEMS_CREATED,
+            status.HTTP_201_CREATED,
+            count=len(items),
+        )
+    except Exception as e:
+        logger.error(f"Error creating items in batch: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error creating items: {str(e)}"
+        )
+
+
+# Get items in batch
+@app.post("/items:batchGet", responses={200: {"model": ItemListResponse}})
+@app.post("/python/items:batchGet", responses={200: {"model": ItemListResponse}})
+async def get_items_batch(batch_data: ItemBatchGet):
+    """Get several items by ID in one request; missing IDs are omitted"""
+    try:
+        items = db_client.get_items_batch(batch_data.ids)
+        return _success_response(
+            _serialize_items(items), _ITEMS_RETRIEVED, count=len(items)
+        )
+    except Exception as e:
+        logger.error(f"Error getting items in batch: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error getting items: {str(e)}"
+        )
+
+
 # Get item by ID
-@app.get("/items/{item_id}", response_model=ItemResponse)
-@app.get("/python/items/{item_id}", response_model=ItemResponse)
+@app.get("/items/{item_id}", responses={200: {"model": ItemResponse}})
+@app.get("/python/items/{item_id}", responses={200: {"model": ItemResponse}})
 async def get_item(item_id: str):
     """Get an item by ID"""
     try:
@@ -98,11 +216,7 @@ async def get_item(item_id: str):
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Item not found: {item_id}"
             )
-        return ItemResponse(
-            success=True,
-            data=item,
-            message="Item retrieved successfully"
-        )
+        return _success_response(_serialize_item(item), _ITEM_RETRIEVED)
     except HTTPException:
         raise
     except Exception as e:
@@ -167,18 +281,15 @@ async def delete_item(item_id: str):
 
 
 # List all items
-@app.get("/items", response_model=ItemListResponse)
-@app.get("/python/items", response_model=ItemListResponse)
+@app.get("/items", responses={200: {"model": ItemListResponse}})
+@app.get("/python/items", responses={200: {"model": ItemListResponse}})
 async def list_items(limit: int = 100):
     """List all items with optional limit"""
     try:
         # TODO: Add pagination support with query parameter for exclusive_start_key
         items, _ = db_client.list_items(limit=limit, exclusive_start_key=None)
-        return ItemListResponse(
-            success=True,
-            data=items,
-            count=len(items),
-            message="Items retrieved successfully"
+        return _success_response(
+            _serialize_items(items), _ITEMS_RETRIEVED, count=len(items)
         )
     except Exception as e:
         logger.error(f"Error listing items: {e}")
@@ -188,19 +299,5 @@ async def list_items(limit: int = 100):
         )
 
 
-# Exception handler for better error responses
-@app.exception_handler(Exception)
-async def global_exception_handler(request, exc):
-    logger.error(f"Unhandled exception: {exc}")
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "success": False,
-            "message": "Internal server error",
-            "detail": str(exc) if os.environ.get('ENVIRONMENT') != 'prod' else None
-        }
-    )
-
-
 # Lambda handler using Mangum
 handler = Mangum(app, lifespan="off")
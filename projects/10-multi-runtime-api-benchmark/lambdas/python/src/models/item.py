@@ -6,9 +6,14 @@ from decimal import Decimal
 
 class ItemBase(BaseModel):
     """Base item model with common fields"""
+    # Strict validation skips coercion branches; unknown fields are rejected up front
+    model_config = ConfigDict(strict=True, extra='forbid')
+
     name: str = Field(..., min_length=1, max_length=100, description="Item name")
     description: Optional[str] = Field(None, max_length=500, description="Item description")
-    price: Decimal = Field(..., gt=0, description="Item price")
+    # Lax on purpose: FastAPI validates the decoded body, where JSON numbers are floats
+    # Serialized as a JSON string ("19.99"), as the original response_model output was
+    price: Decimal = Field(..., gt=0, strict=False, description="Item price")
 
 
 class ItemCreate(ItemBase):
@@ -16,11 +21,23 @@ class ItemCreate(ItemBase):
     pass
 
 
+class ItemBatchCreate(BaseModel):
+    """Model for creating several items in one request"""
+    items: list[ItemCreate] = Field(..., min_length=1, max_length=25, description="Items to create")
+
+
+class ItemBatchGet(BaseModel):
+    """Model for fetching several items by ID in one request"""
+    ids: list[str] = Field(..., min_length=1, max_length=100, description="Item IDs to fetch")
+
+
 class ItemUpdate(BaseModel):
     """Model for updating an existing item (all fields optional)"""
+    model_config = ConfigDict(strict=True, extra='forbid')
+
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = None
-    price: Optional[Decimal] = Field(None, gt=0)
+    price: Optional[Decimal] = Field(None, gt=0, strict=False)
 
 
 class Item(ItemBase):
@@ -29,7 +46,8 @@ class Item(ItemBase):
     created_at: int = Field(..., description="Creation timestamp (epoch milliseconds)")
     updated_at: int = Field(..., description="Last update timestamp (epoch milliseconds)")
 
-    model_config = ConfigDict(from_attributes=True)
+    # Build validator/serializer at import so the cold start pays for it, not the first request
+    model_config = ConfigDict(from_attributes=True, defer_build=False)
 
 
 class ItemResponse(BaseModel):
@@ -1,4 +1,5 @@
 from .dynamodb import DynamoDBClient
 from .metrics import MetricsCollector
+from .middleware import ErrorMiddleware, HealthCheckMiddleware
 
-__all__ = ['DynamoDBClient', 'MetricsCollector']
+__all__ = ['DynamoDBClient', 'MetricsCollector', 'ErrorMiddleware', 'HealthCheckMiddleware']
@@ -1,9 +1,13 @@
 import os
-import time
-import uuid
+import threading
+from random import uniform as _uniform
+from time import sleep as _sleep, time_ns as _time_ns
+from uuid import uuid4 as _uuid4
 from typing import Optional, List
 from decimal import Decimal
 import boto3
+from cachetools import TTLCache
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from aws_lambda_powertools import Logger
 
@@ -11,70 +15,224 @@ from ..models.item import Item, ItemCreate, ItemUpdate
 
 logger = Logger()
 
+# Shared botocore config: keep TCP/TLS connections alive across warm invocations
+_BOTO_CFG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={'mode': 'standard', 'max_attempts': 3},
+    connect_timeout=1,
+    read_timeout=3,
+)
+
+# Region and endpoint are pinned at import so the first request does no resolution work.
+# AWS_REGION is set by Lambda; AWS_ENDPOINT_URL points at LocalStack in docker-compose.
+_REGION = os.environ.get('AWS_REGION') or os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')
+_ENDPOINT_URL = os.environ.get('AWS_ENDPOINT_URL')
+
+# Short TTL keeps hot GETs off DynamoDB while bounding staleness across containers
+_CACHE_MAX_SIZE = 1024
+_CACHE_TTL_SECONDS = 5
+
+# UnprocessedKeys resends: full-jitter exponential backoff from 50 ms, at most 5 retries
+_BATCH_GET_MAX_RETRIES = 5
+_BATCH_GET_BASE_DELAY_SECONDS = 0.05
+
+# Only fetch the attributes Item needs when scanning; every name is aliased to dodge reserved words
+_ITEM_PROJECTION = '#id, #n, #d, #p, #ca, #ua'
+_ITEM_PROJECTION_NAMES = {
+    '#id': 'id',
+    '#n': 'name',
+    '#d': 'description',
+    '#p': 'price',
+    '#ca': 'created_at',
+    '#ua': 'updated_at',
+}
+
 
 class DynamoDBClient:
     """DynamoDB client for item operations"""
 
-    def __init__(self):
+    def __init__(self, dynamodb=None, client=None):
+        """
+        Args:
+            dynamodb: Optional pre-built DynamoDB service resource to reuse
+            client: Optional pre-built low-level DynamoDB client to reuse
+        """
         self.table_name = os.environ.get('TABLE_NAME', 'dev-benchmark-items')
-        self.dynamodb = boto3.resource('dynamodb')
+        # Credentials are resolved by botocore while these clients are created, i.e. during init
+        self.dynamodb = dynamodb or boto3.resource(
+            'dynamodb', region_name=_REGION, endpoint_url=_ENDPOINT_URL, config=_BOTO_CFG
+        )
         self.table = self.dynamodb.Table(self.table_name)
-        logger.info(f"DynamoDB client initialized for table: {self.table_name}")
+        # Separate low-level client for hot writes with prebuilt AttributeValues. The
+        # resource's own meta.client has TypeSerializer hooks registered on it.
+        self.client = client or boto3.client(
+            'dynamodb', region_name=_REGION, endpoint_url=_ENDPOINT_URL, config=_BOTO_CFG
+        )
+        # Per-container read cache. TTLCache is not thread-safe, so the lock guards it for
+        # sync callers or threads sharing the client (the async routes never run in parallel)
+        self._cache = TTLCache(maxsize=_CACHE_MAX_SIZE, ttl=_CACHE_TTL_SECONDS)
+        self._cache_lock = threading.Lock()
+        logger.info("DynamoDB client initialized", extra={"table_name": self.table_name})
 
     @staticmethod
     def _current_timestamp() -> int:
         """Get current timestamp in milliseconds"""
-        return int(time.time() * 1000)
+        # Integer-only path: no float multiply and no int() round-trip
+        return _time_ns() // 1_000_000
 
     @staticmethod
-    def _decimal_to_float(obj):
-        """Convert Decimal to float for JSON serialization"""
-        if isinstance(obj, Decimal):
-            return float(obj)
-        raise TypeError
+    def _item_from_row(row: dict) -> Item:
+        """Build an Item from a trusted DynamoDB row without re-running validation"""
+        # DynamoDB returns every number as Decimal, so only the timestamps need narrowing
+        return Item.model_construct(
+            id=row['id'],
+            name=row['name'],
+            description=row.get('description'),
+            price=row['price'],
+            created_at=int(row['created_at']),
+            updated_at=int(row['updated_at']),
+        )
 
-    def create_item(self, item_data: ItemCreate) -> Item:
-        """Create a new item in DynamoDB"""
-        item_id = str(uuid.uuid4())
-        current_time = self._current_timestamp()
+    @staticmethod
+    def _item_from_attributes(attributes: dict) -> Item:
+        """Build an Item from low-level AttributeValues without TypeDeserializer"""
+        description = attributes.get('description')
+        return Item.model_construct(
+            id=attributes['id']['S'],
+            name=attributes['name']['S'],
+            description=description['S'] if description else None,
+            price=Decimal(attributes['price']['N']),
+            created_at=int(attributes['created_at']['N']),
+            updated_at=int(attributes['updated_at']['N']),
+        )
 
-        item = {
-            'id': item_id,
+    def _new_item_row(self, item_data: ItemCreate) -> dict:
+        """Build the DynamoDB row for a new item"""
+        current_time = self._current_timestamp()
+        return {
+            'id': str(_uuid4()),
             'name': item_data.name,
             'description': item_data.description or '',
-            'price': Decimal(str(item_data.price)),
+            'price': item_data.price,
             'created_at': current_time,
             'updated_at': current_time,
         }
 
+    def create_item(self, item_data: ItemCreate) -> Item:
+        """Create a new item in DynamoDB"""
+        item = self._new_item_row(item_data)
+        item_id = item['id']
+        created_at = str(item['created_at'])
+
         try:
-            self.table.put_item(Item=item)
-            logger.info(f"Created item: {item_id}")
-            return Item(**item)
+            self.client.put_item(
+                TableName=self.table_name,
+                Item={
+                    'id': {'S': item_id},
+                    'name': {'S': item['name']},
+                    'description': {'S': item['description']},
+                    'price': {'N': str(item['price'])},
+                    'created_at': {'N': created_at},
+                    'updated_at': {'N': created_at},
+                },
+            )
+            logger.info("Created item", extra={"item_id": item_id})
+            return Item.model_construct(**item)
         except ClientError as e:
             logger.exception("Error creating item")
             raise
 
+    def create_items_batch(self, items_data: List[ItemCreate]) -> List[Item]:
+        """Create several items using a single batch writer"""
+        rows = [self._new_item_row(item_data) for item_data in items_data]
+
+        try:
+            # batch_writer groups puts into BatchWriteItem calls and resends unprocessed items
+            with self.table.batch_writer() as batch:
+                for row in rows:
+                    batch.put_item(Item=row)
+            logger.info("Created items in batch", extra={"count": len(rows)})
+            return [Item.model_construct(**row) for row in rows]
+        except ClientError as e:
+            logger.error("Error creating items in batch", extra={"error": str(e)})
+            raise
+
+    def get_items_batch(self, item_ids: List[str]) -> List[Item]:
+        """
+        Get several items by ID with BatchGetItem
+
+        Args:
+            item_ids: Item IDs to fetch (at most 100, duplicates are ignored)
+
+        Returns:
+            Items that exist, in no particular order
+
+        Raises:
+            ClientError: If keys are still unprocessed after the last retry
+        """
+        # BatchGetItem rejects duplicate keys in one request
+        keys = [{'id': item_id} for item_id in dict.fromkeys(item_ids)]
+        request_items = {
+            self.table_name: {
+                'Keys': keys,
+                'ProjectionExpression': _ITEM_PROJECTION,
+                'ExpressionAttributeNames': _ITEM_PROJECTION_NAMES,
+            }
+        }
+        items = []
+
+        try:
+            for attempt in range(_BATCH_GET_MAX_RETRIES + 1):
+                if attempt:
+                    # Back off before resending so a throttled table gets room to recover
+                    _sleep(_uniform(0, _BATCH_GET_BASE_DELAY_SECONDS * 2 ** (attempt - 1)))
+                response = self.dynamodb.batch_get_item(RequestItems=request_items)
+                rows = response.get('Responses', {}).get(self.table_name, [])
+                items.extend(self._item_from_row(row) for row in rows)
+                # Throttled keys come back as UnprocessedKeys and have to be requested again
+                request_items = response.get('UnprocessedKeys')
+                if not request_items:
+                    break
+            else:
+                unprocessed = len(request_items[self.table_name]['Keys'])
+                error = {
+                    'Code': 'ProvisionedThroughputExceededException',
+                    'Message': f"{unprocessed} keys still unprocessed after "
+                               f"{_BATCH_GET_MAX_RETRIES} retries",
+                }
+                raise ClientError({'Error': error}, 'BatchGetItem')
+            logger.info(
+                "Retrieved items in batch", extra={"count": len(items), "requested": len(keys)}
+            )
+            return items
+        except ClientError as e:
+            logger.error("Error getting items in batch", extra={"error": str(e)})
+            raise
+
     def get_item(self, item_id: str) -> Optional[Item]:
-        """Get an item by ID"""
+        """Get an item by ID, served from the TTL cache when possible"""
+        with self._cache_lock:
+            cached = self._cache.get(item_id)
+        if cached is not None:
+            return cached
+
         try:
             response = self.table.get_item(Key={'id': item_id})
             if 'Item' in response:
-                logger.info(f"Retrieved item: {item_id}")
-                return Item(**response['Item'])
-            logger.warning(f"Item not found: {item_id}")
+                logger.info("Retrieved item", extra={"item_id": item_id})
+                item = self._item_from_row(response['Item'])
+                with self._cache_lock:
+                    self._cache[item_id] = item
+                return item
+            logger.warning("Item not found", extra={"item_id": item_id})
             return None
         except ClientError as e:
-            logger.error(f"Error getting item {item_id}: {e}")
+            logger.error("Error getting item", extra={"item_id": item_id, "error": str(e)})
             raise
 
     def update_item(self, item_id: str, item_data: ItemUpdate) -> Optional[Item]:
-        """Update an existing item"""
-        # First check if item exists
-        existing_item = self.get_item(item_id)
-        if not existing_item:
-            return None
-
+        """Update an existing item, returning None if it does not exist"""
         # Build update expression
         update_parts = []
         expression_values = {}
@@ -82,50 +240,66 @@ class DynamoDBClient:
 
         if item_data.name is not None:
             update_parts.append('#n = :name')
-            expression_values[':name'] = item_data.name
+            expression_values[':name'] = {'S': item_data.name}
             expression_names['#n'] = 'name'
 
         if item_data.description is not None:
             update_parts.append('description = :description')
-            expression_values[':description'] = item_data.description
+            expression_values[':description'] = {'S': item_data.description}
 
         if item_data.price is not None:
             update_parts.append('price = :price')
-            expression_values[':price'] = Decimal(str(item_data.price))
+            expression_values[':price'] = {'N': str(item_data.price)}
 
         # Always update timestamp
         update_parts.append('updated_at = :updated_at')
-        expression_values[':updated_at'] = self._current_timestamp()
+        expression_values[':updated_at'] = {'N': str(self._current_timestamp())}
 
-        update_expression = 'SET ' + ', '.join(update_parts)
+        update_kwargs = {
+            'TableName': self.table_name,
+            'Key': {'id': {'S': item_id}},
+            'UpdateExpression': 'SET ' + ', '.join(update_parts),
+            # Existence check happens server-side in the same round-trip
+            'ConditionExpression': 'attribute_exists(id)',
+            'ExpressionAttributeValues': expression_values,
+            'ReturnValues': 'ALL_NEW',
+        }
+        if expression_names:
+            update_kwargs['ExpressionAttributeNames'] = expression_names
 
         try:
-            response = self.table.update_item(
-                Key={'id': item_id},
-                UpdateExpression=update_expression,
-                ExpressionAttributeValues=expression_values,
-                ExpressionAttributeNames=expression_names if expression_names else None,
-                ReturnValues='ALL_NEW'
-            )
-            logger.info(f"Updated item: {item_id}")
-            return Item(**response['Attributes'])
+            response = self.client.update_item(**update_kwargs)
+            logger.info("Updated item", extra={"item_id": item_id})
+            item = self._item_from_attributes(response['Attributes'])
+            with self._cache_lock:
+                self._cache[item_id] = item
+            return item
         except ClientError as e:
-            logger.error(f"Error updating item {item_id}: {e}")
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                with self._cache_lock:
+                    self._cache.pop(item_id, None)
+                logger.warning("Item not found", extra={"item_id": item_id})
+                return None
+            logger.error("Error updating item", extra={"item_id": item_id, "error": str(e)})
             raise
 
     def delete_item(self, item_id: str) -> bool:
-        """Delete an item"""
+        """Delete an item, returning False if it does not exist"""
         try:
-            # Check if item exists first
-            existing_item = self.get_item(item_id)
-            if not existing_item:
+            # ALL_OLD returns the deleted attributes, so an empty response means no item
+            response = self.table.delete_item(Key={'id': item_id}, ReturnValues='ALL_OLD')
+            # Evict only once the delete has landed; evicting first let a concurrent
+            # get_item re-cache the row and serve it for the rest of the TTL
+            with self._cache_lock:
+                self._cache.pop(item_id, None)
+            if not response.get('Attributes'):
+                logger.warning("Item not found", extra={"item_id": item_id})
                 return False
 
-            self.table.delete_item(Key={'id': item_id})
-            logger.info(f"Deleted item: {item_id}")
+            logger.info("Deleted item", extra={"item_id": item_id})
             return True
         except ClientError as e:
-            logger.error(f"Error deleting item {item_id}: {e}")
+            logger.error("Error deleting item", extra={"item_id": item_id, "error": str(e)})
             raise
 
     def list_items(
@@ -146,18 +320,24 @@ class DynamoDBClient:
         try:
             actual_limit = limit if limit > 0 else 100
 
-            scan_kwargs = {'Limit': actual_limit}
+            scan_kwargs = {
+                'Limit': actual_limit,
+                'ProjectionExpression': _ITEM_PROJECTION,
+                'ExpressionAttributeNames': _ITEM_PROJECTION_NAMES,
+            }
             if exclusive_start_key:
                 scan_kwargs['ExclusiveStartKey'] = exclusive_start_key
 
             response = self.table.scan(**scan_kwargs)
-            items = [Item(**item) for item in response.get('Items', [])]
+            items = [self._item_from_row(item) for item in response.get('Items', [])]
             last_evaluated_key = response.get('LastEvaluatedKey')
 
-            has_more = last_evaluated_key is not None
-            logger.info(f"Listed {len(items)} items (hasMore: {has_more})")
+            logger.debug(
+                "Listed items",
+                extra={"count": len(items), "has_more": last_evaluated_key is not None},
+            )
 
             return items, last_evaluated_key
         except ClientError as e:
-            logger.error(f"Error listing items: {e}")
+            logger.error("Error listing items", extra={"error": str(e)})
             raise
@@ -1,11 +1,19 @@
 import os
+import sys
 import time
-import json
 from typing import Dict, Any
+import psutil
 from aws_lambda_powertools import Logger
 
 logger = Logger()
 
+# Resolved once per container so warm invocations skip the import and process lookup
+_PROCESS = psutil.Process()
+_PY_VERSION = sys.version
+
+# True until the first collector is created in this container
+_IS_COLD = True
+
 
 class MetricsCollector:
     """Collect and report runtime metrics"""
@@ -13,28 +21,15 @@ class MetricsCollector:
     def __init__(self):
         self.runtime_name = os.environ.get('RUNTIME_NAME', 'python')
         self.start_time = time.time()
-        self.cold_start = self._detect_cold_start()
-
-    @staticmethod
-    def _detect_cold_start() -> bool:
-        """Detect if this is a cold start"""
-        # Simple detection: check if global variable exists
-        # In production, use Lambda Powertools or custom logic
-        global _warm_start
-        try:
-            _warm_start
-            return False
-        except NameError:
-            _warm_start = True
-            return True
+
+        # Only the first collector in a fresh container sees a cold start
+        global _IS_COLD
+        self.cold_start = _IS_COLD
+        _IS_COLD = False
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get current runtime metrics"""
-        import psutil
-        import sys
-
-        process = psutil.Process()
-        memory_info = process.memory_info()
+        memory_info = _PROCESS.memory_info()
 
         metrics = {
             'runtime': self.runtime_name,
@@ -44,7 +39,7 @@ class MetricsCollector:
                 'rss_mb': memory_info.rss / 1024 / 1024,  # Resident Set Size
                 'vms_mb': memory_info.vms / 1024 / 1024,  # Virtual Memory Size
             },
-            'python_version': sys.version,
+            'python_version': _PY_VERSION,
             'environment': os.environ.get('ENVIRONMENT', 'dev'),
         }
 
@@ -58,5 +53,6 @@ class MetricsCollector:
                 'log_stream': os.environ.get('AWS_LAMBDA_LOG_STREAM_NAME'),
             }
 
-        logger.info(f"Collected metrics: {json.dumps(metrics, default=str)}")
+        # Powertools serializes extra fields itself; debug keeps /metrics quiet in prod
+        logger.debug("Collected metrics", extra={"metrics": metrics})
         return metrics
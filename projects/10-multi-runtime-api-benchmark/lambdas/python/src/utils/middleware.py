@@ -0,0 +1,69 @@
+import os
+
+import orjson
+from aws_lambda_powertools import Logger
+
+logger = Logger()
+
+_JSON_HEADERS = [(b'content-type', b'application/json')]
+
+
+class ErrorMiddleware:
+    """Pure ASGI middleware that turns unhandled exceptions into a JSON 500 response"""
+
+    def __init__(self, app):
+        self.app = app
+        # Resolved once when the middleware stack is built, not on every error
+        self.expose_detail = os.environ.get('ENVIRONMENT') != 'prod'
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message['type'] == 'http.response.start':
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            logger.exception("Unhandled exception")
+            # Headers are already on the wire, so there is no way to send a clean 500
+            if response_started:
+                raise
+
+            body = orjson.dumps({
+                'success': False,
+                'message': 'Internal server error',
+                'detail': str(exc) if self.expose_detail else None,
+            })
+            await send({
+                'type': 'http.response.start',
+                'status': 500,
+                'headers': _JSON_HEADERS + [(b'content-length', str(len(body)).encode())],
+            })
+            await send({'type': 'http.response.body', 'body': body})
+
+
+class HealthCheckMiddleware:
+    """Pure ASGI middleware that answers health checks with a pre-serialized body"""
+
+    def __init__(self, app, paths, payload):
+        self.app = app
+        self.paths = frozenset(paths)
+        # Serialized once so every probe is just two send() calls
+        self.body = orjson.dumps(payload)
+        self.headers = _JSON_HEADERS + [(b'content-length', str(len(self.body)).encode())]
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] != 'GET' or scope['path'] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        await send({'type': 'http.response.start', 'status': 200, 'headers': self.headers})
+        await send({'type': 'http.response.body', 'body': self.body})
@@ -0,0 +1,25 @@
+import pytest
+from decimal import Decimal
+
+from src.models.item import ItemCreate
+
+_ITEM = ItemCreate(name="Bench Item", price=Decimal("1.00"))
+
+
+class TestDynamoDBClientBenchmarks:
+    """Micro-benchmarks for the hot DynamoDBClient calls against moto"""
+
+    def test_bench_create_item(self, benchmark, dynamodb_client, mock_dynamodb_table):
+        """Benchmark a single PutItem round trip"""
+        item = benchmark(dynamodb_client.create_item, _ITEM)
+
+        assert item.name == "Bench Item"
+
+    @pytest.mark.parametrize("limit", [10, 100])
+    def test_bench_list_items(self, benchmark, dynamodb_client, seed_items, limit):
+        """Benchmark a projected Scan page"""
+        seed_items(100)
+
+        items, _ = benchmark(dynamodb_client.list_items, limit=limit)
+
+        assert len(items) == limit
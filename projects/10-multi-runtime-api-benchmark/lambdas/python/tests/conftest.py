@@ -0,0 +1,199 @@
+import os
+import pytest
+import boto3
+from decimal import Decimal
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from moto import mock_dynamodb
+
+from src.utils.dynamodb import DynamoDBClient
+
+TEST_TABLE_NAME = "test-benchmark-items"
+_SEED_PRICE = Decimal("10.00")
+
+# Larger keep-alive pool for the session-wide clients shared by every test on a worker
+_BOTO_CFG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"max_attempts": 2, "mode": "standard"},
+)
+
+# The single moto activation for this worker. It starts at collection so the DynamoDB
+# service and resource models load here, with moto's fake credentials cached on the
+# session, instead of inside the first test; the autouse _moto_backend stops it at session end.
+_MOTO = mock_dynamodb()
+_MOTO.start()
+_BOTO_SESSION = boto3.Session(region_name="us-east-1")
+_BOTO_SESSION.resource("dynamodb").meta.client.list_tables()
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+class FakeTable:
+    """In-memory stand-in for the resource Table calls DynamoDBClient makes"""
+
+    def __init__(self):
+        self._items = {}
+
+    def get_item(self, Key):
+        row = self._items.get(Key["id"])
+        return {"Item": dict(row)} if row else {}
+
+    def delete_item(self, Key, ReturnValues="NONE"):
+        row = self._items.pop(Key["id"], None)
+        return {"Attributes": row} if row and ReturnValues == "ALL_OLD" else {}
+
+    def scan(self, Limit=None, **kwargs):
+        items = list(self._items.values())[:Limit]
+        return {"Items": items, "Count": len(items)}
+
+
+class FakeLowLevelClient:
+    """In-memory stand-in for the low-level client calls, backed by a FakeTable"""
+
+    def __init__(self, table):
+        self._table = table
+
+    def put_item(self, TableName, Item):
+        row = {k: _deserializer.deserialize(v) for k, v in Item.items()}
+        self._table._items[row["id"]] = row
+
+    def update_item(
+        self, TableName, Key, UpdateExpression, ExpressionAttributeValues,
+        ExpressionAttributeNames=None, **kwargs
+    ):
+        # Only the attribute_exists(id) condition DynamoDBClient uses is modelled
+        row = self._table._items.get(Key["id"]["S"])
+        if row is None:
+            error = {
+                "Code": "ConditionalCheckFailedException",
+                "Message": "The conditional request failed",
+            }
+            raise ClientError({"Error": error}, "UpdateItem")
+
+        names = ExpressionAttributeNames or {}
+        for assignment in UpdateExpression.removeprefix("SET ").split(", "):
+            name, placeholder = assignment.split(" = ")
+            row[names.get(name, name)] = _deserializer.deserialize(
+                ExpressionAttributeValues[placeholder]
+            )
+        return {"Attributes": {k: _serializer.serialize(v) for k, v in row.items()}}
+
+
+@pytest.fixture(scope="session")
+def table_name():
+    """Namespace the test table per xdist worker ("master" when run serially)"""
+    # Read from the environment so the suite also runs with -p no:xdist (benchmarks)
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    return f"{TEST_TABLE_NAME}-{worker_id}"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _env(table_name):
+    """Set the environment every test expects once for the whole session"""
+    mp = pytest.MonkeyPatch()
+    mp.setenv("TABLE_NAME", table_name)
+    mp.setenv("RUNTIME_NAME", "python")
+    mp.setenv("ENVIRONMENT", "test")
+    yield
+    mp.undo()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _prime_psutil():
+    """Warm the cached psutil handle so the first metrics test pays no /proc lookup"""
+    import src.utils.metrics as metrics_module
+
+    metrics_module._PROCESS.memory_info()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _moto_backend():
+    """Stop the moto backend started at import when the session ends, whatever tests ran"""
+    yield
+    _MOTO.stop()
+
+
+@pytest.fixture(scope="session")
+def boto_session(_moto_backend):
+    """Share the pre-warmed boto3 Session so service models are loaded once"""
+    return _BOTO_SESSION
+
+
+@pytest.fixture(scope="session")
+def dynamodb_resource(boto_session):
+    """Create the boto3 DynamoDB resource once"""
+    return boto_session.resource("dynamodb", config=_BOTO_CFG)
+
+
+@pytest.fixture(scope="session")
+def _session_dynamodb_client(boto_session, dynamodb_resource):
+    """Create a single DynamoDBClient bound to the test table"""
+    client = boto_session.client("dynamodb", config=_BOTO_CFG)
+    return DynamoDBClient(dynamodb=dynamodb_resource, client=client)
+
+
+@pytest.fixture
+def dynamodb_client(_session_dynamodb_client):
+    """Provide the shared DynamoDBClient with an empty read cache"""
+    _session_dynamodb_client._cache.clear()
+    return _session_dynamodb_client
+
+
+@pytest.fixture
+def fake_dynamodb_client(_session_dynamodb_client, monkeypatch):
+    """Point the shared DynamoDBClient at an in-memory table instead of moto"""
+    table = FakeTable()
+    monkeypatch.setattr(_session_dynamodb_client, "table", table)
+    monkeypatch.setattr(_session_dynamodb_client, "client", FakeLowLevelClient(table))
+    _session_dynamodb_client._cache.clear()
+    return _session_dynamodb_client
+
+
+@pytest.fixture(scope="session")
+def _test_table(dynamodb_resource, table_name):
+    """Create the test table once per worker"""
+    return dynamodb_resource.create_table(
+        TableName=table_name,
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+
+
+@pytest.fixture
+def mock_dynamodb_table(_test_table):
+    """Provide the test table and empty it afterwards instead of dropping it"""
+    yield _test_table
+
+    scan_kwargs = {"ProjectionExpression": "id"}
+    with _test_table.batch_writer() as batch:
+        while True:
+            response = _test_table.scan(**scan_kwargs)
+            for row in response["Items"]:
+                batch.delete_item(Key={"id": row["id"]})
+            if "LastEvaluatedKey" not in response:
+                break
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+@pytest.fixture
+def seed_items(mock_dynamodb_table):
+    """Return a helper that writes n items straight to the table in batches"""
+
+    def _seed(n):
+        with mock_dynamodb_table.batch_writer() as batch:
+            for i in range(n):
+                batch.put_item(
+                    Item={
+                        "id": f"seed-{i}",
+                        "name": f"Item {i}",
+                        "price": _SEED_PRICE,
+                        "created_at": 1704067200000,
+                        "updated_at": 1704067200000,
+                    }
+                )
+
+    return _seed
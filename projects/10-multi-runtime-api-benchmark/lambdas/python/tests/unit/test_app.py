@@ -2,13 +2,16 @@ import pytest
 from fastapi.testclient import TestClient
 from decimal import Decimal
 from unittest.mock import patch, Mock, MagicMock
-from moto import mock_dynamodb
 import boto3
 import os
 
 from src.app import app
 from src.models.item import Item
 
+_P10 = Decimal("10.00")
+_P1999 = Decimal("19.99")
+_P2999 = Decimal("29.99")
+
 
 @pytest.fixture
 def client():
@@ -37,7 +40,7 @@ def sample_item():
         id="test-id-123",
         name="Test Item",
         description="Test Description",
-        price=Decimal("19.99"),
+        price=_P1999,
         created_at=1704067200000,
         updated_at=1704067200000,
     )
@@ -193,6 +196,54 @@ class TestCreateItem:
         assert response.status_code == 500
 
 
+class TestBatchEndpoints:
+    """Test batch create and batch get endpoints"""
+
+    def test_create_items_batch_success(self, client, mock_db_client, sample_item):
+        """Test creating several items at once"""
+        mock_db_client.create_items_batch.return_value = [sample_item, sample_item]
+
+        response = client.post(
+            "/items:batch",
+            json={"items": [{"name": "A", "price": 1.5}, {"name": "B", "price": 2.5}]},
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["success"] is True
+        assert data["count"] == 2
+        assert len(mock_db_client.create_items_batch.call_args[0][0]) == 2
+
+    def test_create_items_batch_empty(self, client):
+        """Test that an empty batch is rejected"""
+        response = client.post("/items:batch", json={"items": []})
+
+        assert response.status_code == 422
+
+    def test_get_items_batch_success(self, client, mock_db_client, sample_item):
+        """Test fetching several items at once"""
+        mock_db_client.get_items_batch.return_value = [sample_item]
+
+        response = client.post(
+            "/python/items:batchGet",
+            json={"ids": ["test-id-123", "missing-id"]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 1
+        assert data["data"][0]["id"] == "test-id-123"
+        mock_db_client.get_items_batch.assert_called_once_with(["test-id-123", "missing-id"])
+
+    def test_get_items_batch_db_error(self, client, mock_db_client):
+        """Test batch get with database error"""
+        mock_db_client.get_items_batch.side_effect = Exception("Database error")
+
+        response = client.post("/items:batchGet", json={"ids": ["test-id-123"]})
+
+        assert response.status_code == 500
+
+
 class TestGetItem:
     """Test get item endpoint"""
 
@@ -207,6 +258,7 @@ class TestGetItem:
         assert data["success"] is True
         assert data["data"]["id"] == "test-id-123"
         assert data["data"]["name"] == "Test Item"
+        assert data["data"]["price"] == "19.99"  # Decimal string, as response_model emitted
 
     def test_get_item_not_found(self, client, mock_db_client):
         """Test getting non-existent item"""
@@ -233,7 +285,7 @@ class TestUpdateItem:
     def test_update_item_success(self, client, mock_db_client, sample_item):
         """Test successful item update"""
         updated_item = sample_item.model_copy(
-            update={"name": "Updated Name", "price": Decimal("29.99")}
+            update={"name": "Updated Name", "price": _P2999}
         )
         mock_db_client.update_item.return_value = updated_item
 
@@ -249,7 +301,7 @@ class TestUpdateItem:
 
     def test_update_item_partial(self, client, mock_db_client, sample_item):
         """Test partial item update"""
-        updated_item = sample_item.model_copy(update={"price": Decimal("29.99")})
+        updated_item = sample_item.model_copy(update={"price": _P2999})
         mock_db_client.update_item.return_value = updated_item
 
         response = client.put(
@@ -322,13 +374,13 @@ class TestListItems:
             Item(
                 id=f"id-{i}",
                 name=f"Item {i}",
-                price=Decimal("10.00"),
+                price=_P10,
                 created_at=1704067200000,
                 updated_at=1704067200000,
             )
             for i in range(3)
         ]
-        mock_db_client.list_items.return_value = items
+        mock_db_client.list_items.return_value = (items, None)
 
         response = client.get("/items")
 
@@ -340,7 +392,7 @@ class TestListItems:
 
     def test_list_items_empty(self, client, mock_db_client):
         """Test listing when no items exist"""
-        mock_db_client.list_items.return_value = []
+        mock_db_client.list_items.return_value = ([], None)
 
         response = client.get("/items")
 
@@ -356,20 +408,22 @@ class TestListItems:
             Item(
                 id=f"id-{i}",
                 name=f"Item {i}",
-                price=Decimal("10.00"),
+                price=_P10,
                 created_at=1704067200000,
                 updated_at=1704067200000,
             )
             for i in range(2)
         ]
-        mock_db_client.list_items.return_value = items
+        mock_db_client.list_items.return_value = (items, None)
 
         response = client.get("/items?limit=50")
 
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
-        mock_db_client.list_items.assert_called_once_with(limit=50)
+        mock_db_client.list_items.assert_called_once_with(
+            limit=50, exclusive_start_key=None
+        )
 
     def test_list_items_db_error(self, client, mock_db_client):
         """Test list items with database error"""
@@ -385,7 +439,7 @@ class TestCORS:
 
     def test_cors_headers_present(self, client):
         """Test that CORS headers are present"""
-        response = client.get("/health")
+        response = client.get("/health", headers={"Origin": "https://example.com"})
 
         assert "access-control-allow-origin" in response.headers
         assert response.headers["access-control-allow-origin"] == "*"
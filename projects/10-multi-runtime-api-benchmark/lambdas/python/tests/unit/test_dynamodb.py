@@ -1,256 +1,295 @@
 import pytest
-import os
+import time
 from decimal import Decimal
+from botocore.exceptions import ClientError
 from unittest.mock import Mock, patch, MagicMock
-from moto import mock_dynamodb
-import boto3
 
-from src.utils.dynamodb import DynamoDBClient
 from src.models.item import ItemCreate, ItemUpdate
 
-
-@pytest.fixture
-def mock_table_name():
-    """Provide a test table name"""
-    return "test-benchmark-items"
+# Shared price constants so tests do not re-parse Decimal strings
+_P1 = Decimal("1.00")
+_P10 = Decimal("10.00")
+_P1999 = Decimal("19.99")
+_P20 = Decimal("20.00")
+_P30 = Decimal("30.00")
 
 
 @pytest.fixture
-def dynamodb_client(mock_table_name):
-    """Create DynamoDB client with mocked table"""
-    with patch.dict(os.environ, {"TABLE_NAME": mock_table_name}):
-        client = DynamoDBClient()
-        return client
-
-
-@pytest.fixture
-def mock_dynamodb_table():
-    """Create a real mock DynamoDB table using moto"""
-    with mock_dynamodb():
-        # Create DynamoDB resource
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-        # Create table
-        table = dynamodb.create_table(
-            TableName="test-benchmark-items",
-            KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
-            AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
-            BillingMode="PAY_PER_REQUEST",
-        )
-
-        yield table
+def mock_table_name(table_name):
+    """Provide a test table name"""
+    return table_name
 
 
+@pytest.mark.xdist_group("dynamodb")
 class TestDynamoDBClient:
     """Test DynamoDB client"""
 
-    def test_init(self, dynamodb_client, mock_table_name):
+    def test_init(self, dynamodb_client, mock_table_name, dynamodb_resource):
         """Test client initialization"""
         assert dynamodb_client.table_name == mock_table_name
-        assert dynamodb_client.dynamodb is not None
+        assert dynamodb_client.dynamodb is dynamodb_resource
         assert dynamodb_client.table is not None
 
     def test_current_timestamp(self, dynamodb_client):
         """Test timestamp generation"""
-        timestamp1 = dynamodb_client._current_timestamp()
-        timestamp2 = dynamodb_client._current_timestamp()
-
-        assert isinstance(timestamp1, int)
-        assert isinstance(timestamp2, int)
-        assert timestamp2 >= timestamp1
-
-    @mock_dynamodb
-    def test_create_item(self, mock_dynamodb_table):
-        """Test creating an item"""
-        with patch.dict(os.environ, {"TABLE_NAME": "test-benchmark-items"}):
-            client = DynamoDBClient()
-            item_data = ItemCreate(
-                name="Test Item", description="Test Description", price=Decimal("19.99")
-            )
+        before = time.time_ns() // 1_000_000
+        timestamp = dynamodb_client._current_timestamp()
+        after = time.time_ns() // 1_000_000
+
+        assert isinstance(timestamp, int)
+        assert before <= timestamp <= after
+
+    def test_item_from_attributes(self, dynamodb_client):
+        """Test building an Item from low-level AttributeValues"""
+        item = dynamodb_client._item_from_attributes(
+            {
+                "id": {"S": "abc"},
+                "name": {"S": "Test Item"},
+                "price": {"N": "19.99"},
+                "created_at": {"N": "1704067200000"},
+                "updated_at": {"N": "1704067200001"},
+            }
+        )
+
+        assert item.id == "abc"
+        assert item.description is None
+        assert item.price == _P1999
+        assert item.created_at == 1704067200000
+        assert item.updated_at == 1704067200001
+
+    def test_item_lifecycle(self, dynamodb_client, mock_dynamodb_table, subtests):
+        """Test create, get, update and delete against one item"""
+        client = dynamodb_client
+        item_data = ItemCreate(
+            name="Test Item", description="Test Description", price=_P1999
+        )
 
-            item = client.create_item(item_data)
+        item = client.create_item(item_data)
 
+        with subtests.test("create"):
             assert item.id is not None
             assert item.name == "Test Item"
             assert item.description == "Test Description"
-            assert item.price == Decimal("19.99")
+            assert item.price == _P1999
             assert item.created_at > 0
             assert item.updated_at > 0
             assert item.created_at == item.updated_at
 
-    @mock_dynamodb
-    def test_create_item_without_description(self, mock_dynamodb_table):
-        """Test creating item without description"""
-        with patch.dict(os.environ, {"TABLE_NAME": "test-benchmark-items"}):
-            client = DynamoDBClient()
-            item_data = ItemCreate(name="Test Item", price=Decimal("19.99"))
-
-            item = client.create_item(item_data)
-
-            assert item.description == ""
-
-    @mock_dynamodb
-    def test_get_item_exists(self, mock_dynamodb_table):
-        """Test getting an existing item"""
-        with patch.dict(os.environ, {"TABLE_NAME": "test-benchmark-items"}):
-            client = DynamoDBClient()
-
-            # Create item first
-            item_data = ItemCreate(name="Test Item", price=Decimal("19.99"))
-            created_item = client.create_item(item_data)
-
-            # Get the item
-            retrieved_item = client.get_item(created_item.id)
-
+        with subtests.test("get"):
+            retrieved_item = client.get_item(item.id)
             assert retrieved_item is not None
-            assert retrieved_item.id == created_item.id
-            assert retrieved_item.name == created_item.name
-            assert retrieved_item.price == created_item.price
-
-    @mock_dynamodb
-    def test_get_item_not_exists(self, mock_dynamodb_table):
-        """Test getting a non-existent item"""
-        with patch.dict(os.environ, {"TABLE_NAME": "test-benchmark-items"}):
-            client = DynamoDBClient()
-
-            result = client.get_item("non-existent-id")
-
-            assert result is None
-
-    @mock_dynamodb
-    def test_update_item_all_fields(self, mock_dynamodb_table):
-        """Test updating all fields of an item"""
-        with patch.dict(os.environ, {"TABLE_NAME": "test-benchmark-items"}):
-            client = DynamoDBClient()
+            assert retrieved_item.id == item.id
+            assert retrieved_item.name == item.name
+            assert retrieved_item.price == item.price
 
-            # Create item
-            item_data = ItemCreate(
-                name="Original Name",
-                description="Original Description",
-                price=Decimal("10.00"),
-            )
-            created_item = client.create_item(item_data)
-            original_updated_at = created_item.updated_at
+        with subtests.test("update_partial"):
+            # Update only price
+            updated_item = client.update_item(item.id, ItemUpdate(price=_P20))
+            assert updated_item is not None
+            assert updated_item.name == "Test Item"  # Unchanged
+            assert updated_item.description == "Test Description"  # Unchanged
+            assert updated_item.price == _P20  # Changed
 
-            # Update item
+        with subtests.test("update_all"):
             update_data = ItemUpdate(
                 name="Updated Name",
                 description="Updated Description",
-                price=Decimal("20.00"),
+                price=_P30,
             )
-            updated_item = client.update_item(created_item.id, update_data)
-
+            updated_item = client.update_item(item.id, update_data)
             assert updated_item is not None
-            assert updated_item.id == created_item.id
+            assert updated_item.id == item.id
             assert updated_item.name == "Updated Name"
             assert updated_item.description == "Updated Description"
-            assert updated_item.price == Decimal("20.00")
-            assert updated_item.updated_at > original_updated_at
-
-    @mock_dynamodb
-    def test_update_item_partial(self, mock_dynamodb_table):
-        """Test updating only some fields"""
-        with patch.dict(os.environ, {"TABLE_NAME": "test-benchmark-items"}):
-            client = DynamoDBClient()
-
-            # Create item
-            item_data = ItemCreate(
-                name="Original Name",
-                description="Original Description",
-                price=Decimal("10.00"),
-            )
-            created_item = client.create_item(item_data)
+            assert updated_item.price == _P30
+            assert updated_item.updated_at > item.updated_at
 
-            # Update only price
-            update_data = ItemUpdate(price=Decimal("20.00"))
-            updated_item = client.update_item(created_item.id, update_data)
+        with subtests.test("delete"):
+            assert client.delete_item(item.id) is True
+            # Verify item is deleted
+            assert client.get_item(item.id) is None
 
-            assert updated_item is not None
-            assert updated_item.name == "Original Name"  # Unchanged
-            assert updated_item.description == "Original Description"  # Unchanged
-            assert updated_item.price == Decimal("20.00")  # Changed
+    def test_create_item_without_description(self, fake_dynamodb_client):
+        """Test creating item without description"""
+        client = fake_dynamodb_client
+        item_data = ItemCreate(name="Test Item", price=_P1999)
 
-    @mock_dynamodb
-    def test_update_item_not_exists(self, mock_dynamodb_table):
-        """Test updating a non-existent item"""
-        with patch.dict(os.environ, {"TABLE_NAME": "test-benchmark-items"}):
-            client = DynamoDBClient()
+        item = client.create_item(item_data)
 
-            update_data = ItemUpdate(name="Updated Name")
-            result = client.update_item("non-existent-id", update_data)
+        assert item.description == ""
 
-            assert result is None
+    def test_get_item_not_exists(self, fake_dynamodb_client):
+        """Test getting a non-existent item"""
+        client = fake_dynamodb_client
 
-    @mock_dynamodb
-    def test_delete_item_exists(self, mock_dynamodb_table):
-        """Test deleting an existing item"""
-        with patch.dict(os.environ, {"TABLE_NAME": "test-benchmark-items"}):
-            client = DynamoDBClient()
+        result = client.get_item("non-existent-id")
 
-            # Create item
-            item_data = ItemCreate(name="Test Item", price=Decimal("19.99"))
-            created_item = client.create_item(item_data)
+        assert result is None
 
-            # Delete item
-            result = client.delete_item(created_item.id)
+    def test_update_item_not_exists(self, fake_dynamodb_client):
+        """Test updating a non-existent item"""
+        client = fake_dynamodb_client
 
-            assert result is True
+        update_data = ItemUpdate(name="Updated Name")
+        result = client.update_item("non-existent-id", update_data)
 
-            # Verify item is deleted
-            retrieved_item = client.get_item(created_item.id)
-            assert retrieved_item is None
+        assert result is None
 
-    @mock_dynamodb
-    def test_delete_item_not_exists(self, mock_dynamodb_table):
+    def test_delete_item_not_exists(self, fake_dynamodb_client):
         """Test deleting a non-existent item"""
-        with patch.dict(os.environ, {"TABLE_NAME": "test-benchmark-items"}):
-            client = DynamoDBClient()
+        client = fake_dynamodb_client
 
-            result = client.delete_item("non-existent-id")
+        result = client.delete_item("non-existent-id")
 
-            assert result is False
+        assert result is False
 
-    @mock_dynamodb
-    def test_list_items_empty(self, mock_dynamodb_table):
+    def test_list_items_empty(self, fake_dynamodb_client):
         """Test listing items when table is empty"""
-        with patch.dict(os.environ, {"TABLE_NAME": "test-benchmark-items"}):
-            client = DynamoDBClient()
+        client = fake_dynamodb_client
 
-            items = client.list_items()
+        items, _ = client.list_items()
 
-            assert isinstance(items, list)
-            assert len(items) == 0
+        assert isinstance(items, list)
+        assert len(items) == 0
 
-    @mock_dynamodb
-    def test_list_items_with_data(self, mock_dynamodb_table):
+    def test_list_items_with_data(self, dynamodb_client, seed_items):
         """Test listing items when table has data"""
-        with patch.dict(os.environ, {"TABLE_NAME": "test-benchmark-items"}):
-            client = DynamoDBClient()
+        client = dynamodb_client
 
-            # Create multiple items
-            for i in range(3):
-                item_data = ItemCreate(name=f"Item {i}", price=Decimal("10.00"))
-                client.create_item(item_data)
+        seed_items(3)
 
-            # List items
-            items = client.list_items()
+        # List items
+        items, _ = client.list_items()
 
-            assert isinstance(items, list)
-            assert len(items) == 3
+        assert isinstance(items, list)
+        assert len(items) == 3
 
-    @mock_dynamodb
-    def test_list_items_with_limit(self, mock_dynamodb_table):
+    def test_list_items_with_limit(self, dynamodb_client, seed_items):
         """Test listing items with limit"""
-        with patch.dict(os.environ, {"TABLE_NAME": "test-benchmark-items"}):
-            client = DynamoDBClient()
+        client = dynamodb_client
+
+        seed_items(5)
+
+        # List items with limit
+        items, _ = client.list_items(limit=3)
+
+        assert isinstance(items, list)
+        assert len(items) <= 3
+
+    def test_create_items_batch(self, dynamodb_client, mock_dynamodb_table):
+        """Test creating several items with the batch writer"""
+        client = dynamodb_client
+        items_data = [
+            ItemCreate(name=f"Item {i}", price=_P10) for i in range(3)
+        ]
+
+        items = client.create_items_batch(items_data)
+
+        assert len(items) == 3
+        assert len({item.id for item in items}) == 3
+        assert mock_dynamodb_table.scan()["Count"] == 3
+
+    def test_get_items_batch(self, dynamodb_client, seed_items):
+        """Test fetching several items, skipping missing and duplicate IDs"""
+        client = dynamodb_client
+        seed_items(2)
+        ids = ["seed-0", "seed-1", "seed-0", "non-existent-id"]
+
+        items = client.get_items_batch(ids)
+
+        assert sorted(item.id for item in items) == ["seed-0", "seed-1"]
+        assert all(isinstance(item.created_at, int) for item in items)
+
+    def test_get_items_batch_backs_off_on_unprocessed_keys(
+        self, dynamodb_client, seed_items, monkeypatch
+    ):
+        """Test that throttled keys are resent after a jittered delay"""
+        client = dynamodb_client
+        seed_items(2)
+        batch_get_item = client.dynamodb.batch_get_item
+        requests = []
+
+        def throttle_first_request(RequestItems):
+            requests.append(RequestItems)
+            if len(requests) == 1:
+                return {"Responses": {}, "UnprocessedKeys": RequestItems}
+            return batch_get_item(RequestItems=RequestItems)
+
+        delays = []
+        monkeypatch.setattr(client.dynamodb, "batch_get_item", throttle_first_request)
+        monkeypatch.setattr("src.utils.dynamodb._sleep", delays.append)
+
+        items = client.get_items_batch(["seed-0", "seed-1"])
+
+        assert sorted(item.id for item in items) == ["seed-0", "seed-1"]
+        assert len(requests) == 2
+        assert len(delays) == 1 and 0 <= delays[0] <= 0.05
+
+    def test_get_items_batch_gives_up_after_max_retries(self, dynamodb_client, monkeypatch):
+        """Test that keys DynamoDB never processes raise instead of looping forever"""
+        client = dynamodb_client
+        requests = []
+
+        def always_throttle(RequestItems):
+            requests.append(RequestItems)
+            return {"Responses": {}, "UnprocessedKeys": RequestItems}
+
+        delays = []
+        monkeypatch.setattr(client.dynamodb, "batch_get_item", always_throttle)
+        monkeypatch.setattr("src.utils.dynamodb._sleep", delays.append)
+
+        with pytest.raises(ClientError) as exc_info:
+            client.get_items_batch(["a", "b"])
+
+        assert exc_info.value.response["Error"]["Code"] == "ProvisionedThroughputExceededException"
+        assert len(requests) == 6
+        # Full jitter under a doubling cap: 50, 100, 200, 400, 800 ms
+        assert all(0 <= delay <= 0.05 * 2 ** i for i, delay in enumerate(delays))
+        assert len(delays) == 5
+
+    def test_get_item_served_from_cache(self, fake_dynamodb_client):
+        """Test that a repeated get skips DynamoDB"""
+        client = fake_dynamodb_client
+        created = client.create_item(ItemCreate(name="Cached", price=_P1))
+
+        with patch.object(client.table, "get_item", wraps=client.table.get_item) as spy:
+            first = client.get_item(created.id)
+            second = client.get_item(created.id)
+
+        assert spy.call_count == 1
+        assert second is first
+
+    def test_update_item_refreshes_cache(self, fake_dynamodb_client):
+        """Test that update replaces the cached item"""
+        client = fake_dynamodb_client
+        created = client.create_item(ItemCreate(name="Before", price=_P1))
+        client.get_item(created.id)
+
+        client.update_item(created.id, ItemUpdate(name="After"))
+
+        assert client.get_item(created.id).name == "After"
+
+    def test_delete_item_evicts_cache(self, fake_dynamodb_client):
+        """Test that delete drops the cached item"""
+        client = fake_dynamodb_client
+        created = client.create_item(ItemCreate(name="Gone", price=_P1))
+        client.get_item(created.id)
+
+        client.delete_item(created.id)
+
+        assert client.get_item(created.id) is None
+
+    def test_delete_item_evicts_row_cached_during_delete(self, fake_dynamodb_client, monkeypatch):
+        """Test that a read racing the delete cannot leave the deleted item cached"""
+        client = fake_dynamodb_client
+        created = client.create_item(ItemCreate(name="Racing", price=_P1))
+        table_delete = client.table.delete_item
 
-            # Create multiple items
-            for i in range(5):
-                item_data = ItemCreate(name=f"Item {i}", price=Decimal("10.00"))
-                client.create_item(item_data)
+        def delete_with_concurrent_read(**kwargs):
+            client.get_item(created.id)
+            return table_delete(**kwargs)
 
-            # List items with limit
-            items = client.list_items(limit=3)
+        monkeypatch.setattr(client.table, "delete_item", delete_with_concurrent_read)
 
-            assert isinstance(items, list)
-            assert len(items) <= 3
+        assert client.delete_item(created.id) is True
+        assert client.get_item(created.id) is None
@@ -0,0 +1,87 @@
+import pytest
+import os
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from src.utils.middleware import ErrorMiddleware, HealthCheckMiddleware
+
+
+async def failing_app(scope, receive, send):
+    """ASGI app that always raises"""
+    raise RuntimeError("Something broke")
+
+
+async def ok_app(scope, receive, send):
+    """ASGI app that returns an empty 204"""
+    await send({"type": "http.response.start", "status": 204, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+class TestErrorMiddleware:
+    """Test ErrorMiddleware"""
+
+    def test_passes_through_successful_response(self):
+        """Test that normal responses are untouched"""
+        client = TestClient(ErrorMiddleware(ok_app))
+
+        response = client.get("/anything")
+
+        assert response.status_code == 204
+
+    def test_unhandled_exception_returns_json_500(self):
+        """Test that unhandled exceptions become a JSON 500"""
+        with patch.dict(os.environ, {"ENVIRONMENT": "dev"}):
+            client = TestClient(ErrorMiddleware(failing_app))
+
+            response = client.get("/anything")
+
+        assert response.status_code == 500
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data["success"] is False
+        assert data["message"] == "Internal server error"
+        assert data["detail"] == "Something broke"
+
+    def test_unhandled_exception_hides_detail_in_prod(self):
+        """Test that exception details are not leaked in prod"""
+        with patch.dict(os.environ, {"ENVIRONMENT": "prod"}):
+            client = TestClient(ErrorMiddleware(failing_app))
+
+            response = client.get("/anything")
+
+        assert response.status_code == 500
+        assert response.json()["detail"] is None
+
+
+class TestHealthCheckMiddleware:
+    """Test HealthCheckMiddleware"""
+
+    @pytest.fixture
+    def client(self):
+        """Wrap an always-failing app so any fall-through is visible"""
+        app = HealthCheckMiddleware(
+            ErrorMiddleware(failing_app),
+            paths=("/health",),
+            payload={"status": "healthy"},
+        )
+        return TestClient(app)
+
+    def test_health_path_short_circuits(self, client):
+        """Test that the health path is answered without reaching the app"""
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "healthy"}
+        assert response.headers["content-length"] == str(len(response.content))
+
+    def test_other_paths_reach_app(self, client):
+        """Test that non-health paths are delegated"""
+        response = client.get("/items")
+
+        assert response.status_code == 500
+
+    def test_non_get_health_reaches_app(self, client):
+        """Test that only GET is short-circuited"""
+        response = client.post("/health")
+
+        assert response.status_code == 500
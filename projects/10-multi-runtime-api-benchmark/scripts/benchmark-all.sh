@@ -211,7 +211,7 @@ echo ""
 if [ -f "scripts/visualize-results.py" ]; then
     echo "Generating visualizations..."
 
-    if python3 scripts/visualize-results.py "$RUN_DIR"; then
+    if python3 scripts/visualize-results.py "$RUN_DIR" --charts both; then
         echo -e "${GREEN}  ✓ Visualizations generated${NC}"
     else
         echo -e "${YELLOW}  ⚠️  Failed to generate visualizations${NC}"
@@ -0,0 +1,143 @@
+"""
+Shared loaders for benchmark results, used by compare-results.py and visualize-results.py.
+
+Parsed results are pickled to <results_dir>/.cache.pkl, keyed by CACHE_FORMAT and the
+modification times of the input files, so the second script run on the same directory
+skips parsing.
+"""
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Tuple
+
+import pandas as pd
+
+try:
+    import orjson as _json  # C parser, several times faster on large k6 summaries
+except ImportError:
+    import json as _json
+
+try:
+    import pyarrow  # noqa: F401  (only needed as the pandas CSV engine)
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+RUNTIMES = ['python', 'typescript', 'go', 'kotlin']
+
+CACHE_FILE = '.cache.pkl'
+
+# Bump whenever parsing changes what the cached frames hold, so stale caches are reparsed
+CACHE_FORMAT = 2
+
+# Typed columns let the C parser fill numpy arrays directly instead of boxing every field
+COLD_START_DTYPES = {
+    'runtime': 'category',
+    'iteration': 'int32',
+    'cold_start': 'string',
+    'duration_ms': 'float32',
+    'memory_used_mb': 'float32',
+}
+
+
+def cold_start_flags(column: pd.Series):
+    """Boolean array from the cold_start text column; blank cells count as warm starts."""
+    # measure-cold-starts.sh leaves the cell empty when the probe response was empty,
+    # which the string dtype reads as <NA> and numpy refuses to cast to bool
+    return column.str.lower().eq('true').fillna(False).to_numpy(dtype=bool)
+
+
+def read_cold_start_csv(cold_start_file: Path, **kwargs):
+    """Read cold-starts.csv with typed columns; kwargs are passed to pandas.read_csv."""
+    # pyarrow tokenizes on all cores straight into columnar buffers, but cannot chunk
+    engine = 'c' if 'chunksize' in kwargs else CSV_ENGINE
+    return pd.read_csv(
+        cold_start_file,
+        dtype=COLD_START_DTYPES,
+        usecols=list(COLD_START_DTYPES),
+        engine=engine,
+        **kwargs,
+    )
+
+
+def load_cold_start_data(results_dir: Path) -> Dict[str, pd.DataFrame]:
+    """Load cold start measurements from CSV, grouped by runtime."""
+    cold_start_file = results_dir / "cold-starts.csv"
+
+    if not cold_start_file.exists():
+        print(f"Warning: Cold start file not found: {cold_start_file}")
+        return {}
+
+    df = read_cold_start_csv(cold_start_file)
+    df['cold_start'] = cold_start_flags(df['cold_start'])
+
+    return {runtime: group for runtime, group in df.groupby('runtime', sort=False, observed=True)}
+
+
+def _read_json(path: Path):
+    """Parse one JSON file; both parsers accept bytes and orjson requires them."""
+    return _json.loads(path.read_bytes())
+
+
+def load_load_test_data(results_dir: Path) -> Dict[str, Dict]:
+    """Load k6 load test results from JSON."""
+    files = {}
+
+    for runtime in RUNTIMES:
+        load_test_file = results_dir / f"load-test-{runtime}.json"
+
+        if not load_test_file.exists():
+            print(f"Warning: Load test file not found: {load_test_file}")
+            continue
+
+        files[runtime] = load_test_file
+
+    if not files:
+        return {}
+
+    # Independent files; overlap the reads, which dominate on a cold cache or network share
+    with ThreadPoolExecutor(max_workers=len(files)) as pool:
+        parsed = pool.map(_read_json, files.values())
+        return dict(zip(files, parsed))
+
+
+def _input_fingerprint(results_dir: Path) -> Dict:
+    """Cache format plus the modification time of every input file that exists."""
+    names = ["cold-starts.csv"] + [f"load-test-{runtime}.json" for runtime in RUNTIMES]
+    return {
+        'format': CACHE_FORMAT,
+        'mtimes': {
+            name: (results_dir / name).stat().st_mtime_ns
+            for name in names
+            if (results_dir / name).exists()
+        },
+    }
+
+
+def load(results_dir: Path) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Dict]]:
+    """Return (cold_starts, load_tests), reusing the pickled parse when inputs are unchanged."""
+    cache_file = results_dir / CACHE_FILE
+    fingerprint = _input_fingerprint(results_dir)
+
+    if cache_file.exists():
+        try:
+            # The fingerprint is pickled on its own ahead of the data, so a stale
+            # cache is rejected without unpickling its frames
+            with open(cache_file, 'rb') as f:
+                if pickle.load(f) == fingerprint:
+                    return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+            pass  # Unreadable or stale cache; parse again below
+
+    cold_starts = load_cold_start_data(results_dir)
+    load_tests = load_load_test_data(results_dir)
+
+    try:
+        with open(cache_file, 'wb') as f:
+            pickle.dump(fingerprint, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump((cold_starts, load_tests), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"Warning: Could not write results cache: {e}")
+
+    return cold_starts, load_tests
@@ -4,65 +4,175 @@
 Compare benchmark results across all runtimes and generate a comparison report.
 """
 
-import json
+import io
 import sys
-import csv
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, Any, Tuple
 from datetime import datetime
-from collections import defaultdict
 
+try:
+    import numpy as np
+    import pandas as pd
+    from benchmark_io import (
+        RUNTIMES, cold_start_flags, load, load_load_test_data, read_cold_start_csv,
+    )
+except ImportError as e:
+    print(f"Error: {e}")
+    # benchmark_io lives next to this script; only third-party packages need installing
+    if e.name != "benchmark_io":
+        print("Install with: pip install pandas")
+    sys.exit(1)
+
+# Above this size cold-starts.csv is reduced chunk by chunk instead of loaded whole
+STREAMING_THRESHOLD_BYTES = 64 * 1024 * 1024
+STREAMING_CHUNK_ROWS = 500_000
+
+# Fixed 1 ms buckets for streamed percentiles (~240 KB per runtime with the per-bucket
+# extremes); slower samples are rare and kept exactly instead
+HISTOGRAM_BUCKETS = 10_000
+
+
+class ColdStartStats:
+    """Running cold start aggregates for one runtime; memory use is independent of row count.
+
+    Percentiles use the same linear interpolation as np.percentile on the whole-file
+    path, but samples under 10 s are only known by their 1 ms bucket and that bucket's
+    smallest and largest value. Within a bucket they are taken as evenly spread between
+    the two, so streamed P50/P95/P99 can differ from the exact figures by up to 1 ms;
+    whole-millisecond durations, as measure-cold-starts.sh records, come out exact.
+    Samples of 10 s or more are kept as-is and are exact.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.memory_total = 0.0
+        self.memory_count = 0
+        self.histogram = np.zeros(HISTOGRAM_BUCKETS, dtype=np.int64)
+        self.bucket_min = np.full(HISTOGRAM_BUCKETS, np.inf)
+        self.bucket_max = np.full(HISTOGRAM_BUCKETS, -np.inf)
+        self.overflow = []
+
+    def update(self, durations: np.ndarray, memories: np.ndarray):
+        """Fold in one batch of cold start durations and their memory readings."""
+        if durations.size == 0:
+            return
+
+        memories = memories[memories > 0]
+        in_range = durations < HISTOGRAM_BUCKETS
+        binned = durations[in_range]
+        buckets = np.maximum(binned.astype(np.int64), 0)
+
+        self.count += durations.size
+        self.total += float(durations.sum(dtype=np.float64))
+        self.min = min(self.min, float(durations.min()))
+        self.max = max(self.max, float(durations.max()))
+        self.memory_total += float(memories.sum(dtype=np.float64))
+        self.memory_count += memories.size
+        self.histogram += np.bincount(buckets, minlength=HISTOGRAM_BUCKETS)
+        np.minimum.at(self.bucket_min, buckets, binned)
+        np.maximum.at(self.bucket_max, buckets, binned)
+        if not in_range.all():
+            self.overflow.append(durations[~in_range].astype(np.float64))
+
+    def percentile(self, q: float) -> float:
+        """Linearly interpolated percentile, as np.percentile computes it on the full sample."""
+        cumulative = np.cumsum(self.histogram)
+        overflow = np.sort(np.concatenate(self.overflow)) if self.overflow else np.empty(0)
+
+        def value_at(rank: int) -> float:
+            """Estimate of the rank-th smallest sample (0-based)."""
+            if rank >= cumulative[-1]:
+                return float(overflow[rank - cumulative[-1]])
+            bucket = int(np.searchsorted(cumulative, rank, side='right'))
+            in_bucket = self.histogram[bucket]
+            low, high = self.bucket_min[bucket], self.bucket_max[bucket]
+            if in_bucket == 1:
+                return float(low)
+            offset = rank - (cumulative[bucket] - in_bucket)
+            return float(low + (high - low) * offset / (in_bucket - 1))
+
+        position = (self.count - 1) * q / 100
+        lower = int(position)
+        value = value_at(lower)
+        if lower + 1 < self.count:
+            value += (position - lower) * (value_at(lower + 1) - value)
+
+        return value
+
+    def as_dict(self) -> Dict:
+        """Summary in the shape calculate_cold_start_stats returns."""
+        if self.count == 0:
+            return {
+                'count': 0,
+                'avg_duration': 0,
+                'min_duration': 0,
+                'max_duration': 0,
+                'avg_memory': 0
+            }
 
-def load_cold_start_data(results_dir: Path) -> Dict[str, List[Dict]]:
-    """Load cold start measurements from CSV."""
-    cold_start_file = results_dir / "cold-starts.csv"
-
-    if not cold_start_file.exists():
-        print(f"Warning: Cold start file not found: {cold_start_file}")
-        return {}
+        return {
+            'count': self.count,
+            'avg_duration': self.total / self.count,
+            'min_duration': self.min,
+            'max_duration': self.max,
+            'p50_duration': self.percentile(50),
+            'p95_duration': self.percentile(95),
+            'p99_duration': self.percentile(99),
+            'avg_memory': self.memory_total / self.memory_count if self.memory_count else 0
+        }
 
-    data = defaultdict(list)
 
-    with open(cold_start_file, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            runtime = row['runtime']
-            data[runtime].append({
-                'iteration': int(row['iteration']),
-                'cold_start': row['cold_start'].lower() == 'true',
-                'duration_ms': float(row['duration_ms']),
-                'memory_used_mb': float(row['memory_used_mb']),
-                'timestamp': row['timestamp']
-            })
+def stream_cold_start_stats(cold_start_file: Path) -> Dict[str, Dict]:
+    """Reduce a large cold start CSV to per-runtime statistics in one bounded-memory pass."""
+    stats = {}
 
-    return dict(data)
+    for chunk in read_cold_start_csv(cold_start_file, chunksize=STREAMING_CHUNK_ROWS):
+        # Mask the numeric columns directly instead of copying a filtered chunk
+        cold_mask = cold_start_flags(chunk['cold_start'])
+        all_runtimes = chunk['runtime'].to_numpy()
+        runtimes = all_runtimes[cold_mask]
+        durations = chunk['duration_ms'].to_numpy()[cold_mask]
+        memories = chunk['memory_used_mb'].to_numpy()[cold_mask]
 
+        # Every runtime present gets an entry, as on the whole-file path, even with no cold starts
+        for runtime in pd.unique(all_runtimes):
+            selected = runtimes == runtime
+            stats.setdefault(runtime, ColdStartStats()).update(
+                durations[selected], memories[selected]
+            )
 
-def load_load_test_data(results_dir: Path) -> Dict[str, Dict]:
-    """Load k6 load test results from JSON."""
-    data = {}
+    return {runtime: s.as_dict() for runtime, s in stats.items()}
 
-    for runtime in ['python', 'typescript', 'go', 'kotlin']:
-        load_test_file = results_dir / f"load-test-{runtime}.json"
 
-        if not load_test_file.exists():
-            print(f"Warning: Load test file not found: {load_test_file}")
-            continue
+def load_results(results_dir: Path) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+    """Return (cold_start_stats, load_tests), streaming the CSV when it is too large to load"""
+    cold_start_file = results_dir / "cold-starts.csv"
 
-        with open(load_test_file, 'r') as f:
-            data[runtime] = json.load(f)
+    if cold_start_file.exists() and cold_start_file.stat().st_size > STREAMING_THRESHOLD_BYTES:
+        # Percentiles are then accurate to 1 ms below 10 s instead of exact (see ColdStartStats)
+        print("  Large cold start file, using streamed percentiles (within 1 ms below 10 s)")
+        return stream_cold_start_stats(cold_start_file), load_load_test_data(results_dir)
 
-    return data
+    cold_starts, load_tests = load(results_dir)
+    cold_start_stats = {
+        runtime: calculate_cold_start_stats(data) for runtime, data in cold_starts.items()
+    }
+    return cold_start_stats, load_tests
 
 
-def calculate_cold_start_stats(cold_start_data: List[Dict]) -> Dict:
+def calculate_cold_start_stats(cold_start_data: pd.DataFrame) -> Dict:
     """Calculate statistics for cold starts."""
-    if not cold_start_data:
+    if cold_start_data.empty:
         return {}
 
-    cold_starts = [d for d in cold_start_data if d['cold_start']]
+    # Mask the two numeric columns as plain arrays rather than copying a filtered frame
+    cold_mask = cold_start_data['cold_start'].to_numpy(dtype=bool)
+    durations = cold_start_data['duration_ms'].to_numpy()[cold_mask]
 
-    if not cold_starts:
+    if durations.size == 0:
         return {
             'count': 0,
             'avg_duration': 0,
@@ -71,18 +181,46 @@ def calculate_cold_start_stats(cold_start_data: List[Dict]) -> Dict:
             'avg_memory': 0
         }
 
-    durations = [cs['duration_ms'] for cs in cold_starts]
-    memories = [cs['memory_used_mb'] for cs in cold_starts if cs['memory_used_mb'] > 0]
+    # One sort serves min, max and all three percentiles (linearly interpolated between samples)
+    durations.sort()
+    p50, p95, p99 = np.percentile(durations, [50, 95, 99])
+    memories = cold_start_data['memory_used_mb'].to_numpy()[cold_mask]
+    memories = memories[memories > 0]
 
     return {
-        'count': len(cold_starts),
-        'avg_duration': sum(durations) / len(durations),
-        'min_duration': min(durations),
-        'max_duration': max(durations),
-        'p50_duration': sorted(durations)[len(durations) // 2],
-        'p95_duration': sorted(durations)[int(len(durations) * 0.95)],
-        'p99_duration': sorted(durations)[int(len(durations) * 0.99)] if len(durations) > 1 else max(durations),
-        'avg_memory': sum(memories) / len(memories) if memories else 0
+        'count': int(durations.size),
+        'avg_duration': float(durations.mean()),
+        'min_duration': float(durations[0]),
+        'max_duration': float(durations[-1]),
+        'p50_duration': float(p50),
+        'p95_duration': float(p95),
+        'p99_duration': float(p99),
+        'avg_memory': float(memories.mean()) if memories.size else 0
+    }
+
+
+# k6 metric -> (result key, {result field: k6 stat}); a bare string stat yields a scalar
+LOAD_TEST_FIELDS = [
+    ('http_req_duration', 'request_duration',
+     {'avg': 'avg', 'min': 'min', 'max': 'max', 'p50': 'p(50)', 'p95': 'p(95)', 'p99': 'p(99)'}),
+    ('http_reqs', 'requests_per_second', 'rate'),
+    ('errors', 'error_rate', 'rate'),
+    ('http_req_failed', 'failed_request_rate', 'rate'),
+    ('request_count', 'total_requests', 'count'),
+    ('item_creation_duration', 'item_creation_duration', {'avg': 'avg', 'p95': 'p(95)'}),
+    ('item_retrieval_duration', 'item_retrieval_duration', {'avg': 'avg', 'p95': 'p(95)'}),
+]
+
+# Rates k6 reports as fractions but the report shows as percentages
+PERCENT_FIELDS = {'error_rate', 'failed_request_rate'}
+
+
+def flatten_metrics(metrics: Dict) -> Dict[str, float]:
+    """Flatten k6 metrics into {'<metric>.<stat>': value}."""
+    return {
+        f'{name}.{stat}': value
+        for name, metric in metrics.items()
+        for stat, value in metric.get('values', {}).items()
     }
 
 
@@ -92,220 +230,195 @@ def extract_load_test_metrics(load_test_data: Dict) -> Dict:
         return {}
 
     metrics = load_test_data.get('metrics', {})
+    flat = flatten_metrics(metrics)
 
     result = {}
 
-    # HTTP request duration
-    if 'http_req_duration' in metrics:
-        http_duration = metrics['http_req_duration']['values']
-        result['request_duration'] = {
-            'avg': http_duration.get('avg', 0),
-            'min': http_duration.get('min', 0),
-            'max': http_duration.get('max', 0),
-            'p50': http_duration.get('p(50)', 0),
-            'p95': http_duration.get('p(95)', 0),
-            'p99': http_duration.get('p(99)', 0)
-        }
+    for name, key, stats in LOAD_TEST_FIELDS:
+        if name not in metrics:
+            continue
+        if isinstance(stats, str):
+            value = flat.get(f'{name}.{stats}', 0)
+            result[key] = value * 100 if key in PERCENT_FIELDS else value
+        else:
+            result[key] = {field: flat.get(f'{name}.{stat}', 0) for field, stat in stats.items()}
 
-    # Request rate
-    if 'http_reqs' in metrics:
-        http_reqs = metrics['http_reqs']['values']
-        result['requests_per_second'] = http_reqs.get('rate', 0)
-
-    # Error rate
-    if 'errors' in metrics:
-        result['error_rate'] = metrics['errors']['values'].get('rate', 0) * 100
-
-    # Failed requests
-    if 'http_req_failed' in metrics:
-        result['failed_request_rate'] = metrics['http_req_failed']['values'].get('rate', 0) * 100
-
-    # Total requests
-    if 'request_count' in metrics:
-        result['total_requests'] = metrics['request_count']['values'].get('count', 0)
-
-    # Item creation duration
-    if 'item_creation_duration' in metrics:
-        item_creation = metrics['item_creation_duration']['values']
-        result['item_creation_duration'] = {
-            'avg': item_creation.get('avg', 0),
-            'p95': item_creation.get('p(95)', 0)
-        }
+    return result
 
-    # Item retrieval duration
-    if 'item_retrieval_duration' in metrics:
-        item_retrieval = metrics['item_retrieval_duration']['values']
-        result['item_retrieval_duration'] = {
-            'avg': item_retrieval.get('avg', 0),
-            'p95': item_retrieval.get('p(95)', 0)
-        }
 
-    return result
+# Table row templates, parsed once; the bound .format is called per runtime row
+_COLD_START_ROW = (
+    "| {name:11} | {count:5} | {avg_duration:8.2f} | {min_duration:8.2f} | {max_duration:8.2f} | "
+    "{p50_duration:8.2f} | {p95_duration:8.2f} | {p99_duration:8.2f} | {avg_memory:15.2f} |\n"
+).format
+_REQUEST_DURATION_ROW = (
+    "| {name:11} | {avg:8.2f} | {min:8.2f} | {max:8.2f} | {p50:8.2f} | {p95:8.2f} | {p99:8.2f} |\n"
+).format
+_THROUGHPUT_ROW = "| {:11} | {:7.2f} | {:14.0f} | {:14.2f} | {:14.2f} |\n".format
 
+# Closing section; it does not depend on the results, so it is one constant write
+_RECOMMENDATIONS = """\
+## Recommendations
 
-def generate_markdown_report(results_dir: Path, cold_starts: Dict, load_tests: Dict) -> str:
-    """Generate a markdown comparison report."""
-    report = []
+### Best Use Cases
 
-    report.append("# Multi-Runtime API Benchmark - Comparison Report")
-    report.append("")
-    report.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}")
-    report.append("")
-    report.append("---")
-    report.append("")
+- **Go:** Best for latency-sensitive applications and cold start performance
+- **Python:** Good balance of performance and developer productivity
+- **TypeScript:** Familiar for JavaScript developers, moderate performance
+- **Kotlin:** JVM warmup overhead, better for long-running processes
+
+### Performance Optimization
+
+1. **Cold Starts:** Consider provisioned concurrency for critical endpoints
+2. **Memory:** Adjust Lambda memory based on actual usage patterns
+3. **Caching:** Implement response caching at API Gateway level
+4. **Connection Pooling:** Reuse DynamoDB connections across invocations
+"""
 
-    # Cold Start Comparison
-    report.append("## Cold Start Performance")
-    report.append("")
 
-    if cold_starts:
-        report.append("| Runtime | Count | Avg (ms) | Min (ms) | Max (ms) | P50 (ms) | P95 (ms) | P99 (ms) | Avg Memory (MB) |")
-        report.append("|---------|-------|----------|----------|----------|----------|----------|----------|-----------------|")
+def generate_markdown_report(results_dir: Path, cold_start_stats: Dict, load_tests: Dict) -> str:
+    """Generate a markdown comparison report."""
+    buf = io.StringIO()
+    w = buf.write
 
-        for runtime in ['python', 'typescript', 'go', 'kotlin']:
-            if runtime in cold_starts:
-                stats = calculate_cold_start_stats(cold_starts[runtime])
+    w("# Multi-Runtime API Benchmark - Comparison Report\n")
+    w("\n")
+    w(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
+    w("\n")
+    w("---\n")
+    w("\n")
+
+    # Cold Start Comparison
+    w("## Cold Start Performance\n")
+    w("\n")
+
+    if cold_start_stats:
+        w("| Runtime | Count | Avg (ms) | Min (ms) | Max (ms) "
+          "| P50 (ms) | P95 (ms) | P99 (ms) | Avg Memory (MB) |\n")
+        w("|---------|-------|----------|----------|----------"
+          "|----------|----------|----------|-----------------|\n")
+
+        for runtime in RUNTIMES:
+            if runtime in cold_start_stats:
+                stats = cold_start_stats[runtime]
                 if stats.get('count', 0) > 0:
-                    report.append(
-                        f"| {runtime.capitalize():11} | "
-                        f"{stats['count']:5} | "
-                        f"{stats['avg_duration']:8.2f} | "
-                        f"{stats['min_duration']:8.2f} | "
-                        f"{stats['max_duration']:8.2f} | "
-                        f"{stats['p50_duration']:8.2f} | "
-                        f"{stats['p95_duration']:8.2f} | "
-                        f"{stats['p99_duration']:8.2f} | "
-                        f"{stats['avg_memory']:15.2f} |"
-                    )
-
-        report.append("")
-        report.append("### Key Findings (Cold Start)")
-        report.append("")
+                    w(_COLD_START_ROW(name=runtime.capitalize(), **stats))
+
+        w("\n")
+        w("### Key Findings (Cold Start)\n")
+        w("\n")
 
         # Find fastest and slowest
-        runtime_stats = {}
-        for runtime in cold_starts:
-            stats = calculate_cold_start_stats(cold_starts[runtime])
-            if stats.get('count', 0) > 0:
-                runtime_stats[runtime] = stats
+        runtime_stats = {
+            r: stats for r, stats in cold_start_stats.items() if stats.get('count', 0) > 0
+        }
 
         if runtime_stats:
             fastest = min(runtime_stats.items(), key=lambda x: x[1]['avg_duration'])
             slowest = max(runtime_stats.items(), key=lambda x: x[1]['avg_duration'])
 
-            report.append(f"- **Fastest:** {fastest[0].capitalize()} ({fastest[1]['avg_duration']:.2f}ms avg)")
-            report.append(f"- **Slowest:** {slowest[0].capitalize()} ({slowest[1]['avg_duration']:.2f}ms avg)")
-            report.append(f"- **Difference:** {slowest[1]['avg_duration'] - fastest[1]['avg_duration']:.2f}ms "
-                         f"({(slowest[1]['avg_duration'] / fastest[1]['avg_duration'] - 1) * 100:.1f}% slower)")
+            w(f"- **Fastest:** {fastest[0].capitalize()} "
+              f"({fastest[1]['avg_duration']:.2f}ms avg)\n")
+            w(f"- **Slowest:** {slowest[0].capitalize()} "
+              f"({slowest[1]['avg_duration']:.2f}ms avg)\n")
+            fast_ms, slow_ms = fastest[1]['avg_duration'], slowest[1]['avg_duration']
+            w(f"- **Difference:** {slow_ms - fast_ms:.2f}ms "
+              f"({(slow_ms / fast_ms - 1) * 100:.1f}% slower)\n")
 
     else:
-        report.append("*No cold start data available*")
+        w("*No cold start data available*\n")
 
-    report.append("")
-    report.append("---")
-    report.append("")
+    w("\n")
+    w("---\n")
+    w("\n")
 
     # Load Test Comparison
-    report.append("## Load Test Performance")
-    report.append("")
+    w("## Load Test Performance\n")
+    w("\n")
 
     if load_tests:
-        report.append("### Request Duration")
-        report.append("")
-        report.append("| Runtime | Avg (ms) | Min (ms) | Max (ms) | P50 (ms) | P95 (ms) | P99 (ms) |")
-        report.append("|---------|----------|----------|----------|----------|----------|----------|")
-
-        for runtime in ['python', 'typescript', 'go', 'kotlin']:
-            if runtime in load_tests:
-                metrics = extract_load_test_metrics(load_tests[runtime])
-                if 'request_duration' in metrics:
-                    rd = metrics['request_duration']
-                    report.append(
-                        f"| {runtime.capitalize():11} | "
-                        f"{rd['avg']:8.2f} | "
-                        f"{rd['min']:8.2f} | "
-                        f"{rd['max']:8.2f} | "
-                        f"{rd['p50']:8.2f} | "
-                        f"{rd['p95']:8.2f} | "
-                        f"{rd['p99']:8.2f} |"
-                    )
-
-        report.append("")
-        report.append("### Throughput & Error Rates")
-        report.append("")
-        report.append("| Runtime | Req/sec | Total Requests | Error Rate (%) | Failed Req (%) |")
-        report.append("|---------|---------|----------------|----------------|----------------|")
-
-        for runtime in ['python', 'typescript', 'go', 'kotlin']:
-            if runtime in load_tests:
-                metrics = extract_load_test_metrics(load_tests[runtime])
-                report.append(
-                    f"| {runtime.capitalize():11} | "
-                    f"{metrics.get('requests_per_second', 0):7.2f} | "
-                    f"{metrics.get('total_requests', 0):14.0f} | "
-                    f"{metrics.get('error_rate', 0):14.2f} | "
-                    f"{metrics.get('failed_request_rate', 0):14.2f} |"
-                )
+        # Extract once; the tables and the findings below all read from this
+        runtime_metrics = {
+            runtime: extract_load_test_metrics(data) for runtime, data in load_tests.items()
+        }
 
-        report.append("")
-        report.append("### Key Findings (Load Test)")
-        report.append("")
+        w("### Request Duration\n")
+        w("\n")
+        w("| Runtime | Avg (ms) | Min (ms) | Max (ms) | P50 (ms) | P95 (ms) | P99 (ms) |\n")
+        w("|---------|----------|----------|----------|----------|----------|----------|\n")
 
-        # Find best performers
-        runtime_metrics = {}
-        for runtime in load_tests:
-            runtime_metrics[runtime] = extract_load_test_metrics(load_tests[runtime])
+        for runtime in RUNTIMES:
+            if runtime in runtime_metrics:
+                metrics = runtime_metrics[runtime]
+                if 'request_duration' in metrics:
+                    w(_REQUEST_DURATION_ROW(
+                        name=runtime.capitalize(), **metrics['request_duration']
+                    ))
+
+        w("\n")
+        w("### Throughput & Error Rates\n")
+        w("\n")
+        w("| Runtime | Req/sec | Total Requests | Error Rate (%) | Failed Req (%) |\n")
+        w("|---------|---------|----------------|----------------|----------------|\n")
+
+        for runtime in RUNTIMES:
+            if runtime in runtime_metrics:
+                metrics = runtime_metrics[runtime]
+                w(_THROUGHPUT_ROW(
+                    runtime.capitalize(),
+                    metrics.get('requests_per_second', 0),
+                    metrics.get('total_requests', 0),
+                    metrics.get('error_rate', 0),
+                    metrics.get('failed_request_rate', 0),
+                ))
+
+        w("\n")
+        w("### Key Findings (Load Test)\n")
+        w("\n")
 
+        # Find best performers
         if runtime_metrics:
             # Lowest average latency
             if all('request_duration' in m for m in runtime_metrics.values()):
-                fastest = min(runtime_metrics.items(), key=lambda x: x[1]['request_duration']['avg'])
-                slowest = max(runtime_metrics.items(), key=lambda x: x[1]['request_duration']['avg'])
+                fastest = min(
+                    runtime_metrics.items(), key=lambda x: x[1]['request_duration']['avg']
+                )
+                slowest = max(
+                    runtime_metrics.items(), key=lambda x: x[1]['request_duration']['avg']
+                )
 
-                report.append(f"- **Lowest Latency:** {fastest[0].capitalize()} "
-                             f"({fastest[1]['request_duration']['avg']:.2f}ms avg)")
-                report.append(f"- **Highest Latency:** {slowest[0].capitalize()} "
-                             f"({slowest[1]['request_duration']['avg']:.2f}ms avg)")
+                w(f"- **Lowest Latency:** {fastest[0].capitalize()} "
+                  f"({fastest[1]['request_duration']['avg']:.2f}ms avg)\n")
+                w(f"- **Highest Latency:** {slowest[0].capitalize()} "
+                  f"({slowest[1]['request_duration']['avg']:.2f}ms avg)\n")
 
             # Highest throughput
             if all('requests_per_second' in m for m in runtime_metrics.values()):
-                highest_rps = max(runtime_metrics.items(), key=lambda x: x[1].get('requests_per_second', 0))
-                report.append(f"- **Highest Throughput:** {highest_rps[0].capitalize()} "
-                             f"({highest_rps[1]['requests_per_second']:.2f} req/sec)")
+                highest_rps = max(
+                    runtime_metrics.items(), key=lambda x: x[1].get('requests_per_second', 0)
+                )
+                w(f"- **Highest Throughput:** {highest_rps[0].capitalize()} "
+                  f"({highest_rps[1]['requests_per_second']:.2f} req/sec)\n")
 
             # Lowest error rate
             if all('error_rate' in m for m in runtime_metrics.values()):
-                lowest_errors = min(runtime_metrics.items(), key=lambda x: x[1].get('error_rate', 100))
-                report.append(f"- **Lowest Error Rate:** {lowest_errors[0].capitalize()} "
-                             f"({lowest_errors[1]['error_rate']:.2f}%)")
+                lowest_errors = min(
+                    runtime_metrics.items(), key=lambda x: x[1].get('error_rate', 100)
+                )
+                w(f"- **Lowest Error Rate:** {lowest_errors[0].capitalize()} "
+                  f"({lowest_errors[1]['error_rate']:.2f}%)\n")
 
     else:
-        report.append("*No load test data available*")
+        w("*No load test data available*\n")
 
-    report.append("")
-    report.append("---")
-    report.append("")
+    w("\n")
+    w("---\n")
+    w("\n")
 
     # Recommendations
-    report.append("## Recommendations")
-    report.append("")
-    report.append("### Best Use Cases")
-    report.append("")
-    report.append("- **Go:** Best for latency-sensitive applications and cold start performance")
-    report.append("- **Python:** Good balance of performance and developer productivity")
-    report.append("- **TypeScript:** Familiar for JavaScript developers, moderate performance")
-    report.append("- **Kotlin:** JVM warmup overhead, better for long-running processes")
-    report.append("")
-
-    report.append("### Performance Optimization")
-    report.append("")
-    report.append("1. **Cold Starts:** Consider provisioned concurrency for critical endpoints")
-    report.append("2. **Memory:** Adjust Lambda memory based on actual usage patterns")
-    report.append("3. **Caching:** Implement response caching at API Gateway level")
-    report.append("4. **Connection Pooling:** Reuse DynamoDB connections across invocations")
-    report.append("")
-
-    return "\n".join(report)
+    w(_RECOMMENDATIONS)
+
+    return buf.getvalue()
 
 
 def main():
@@ -322,15 +435,14 @@ def main():
     print("Loading benchmark results...")
 
     # Load data
-    cold_starts = load_cold_start_data(results_dir)
-    load_tests = load_load_test_data(results_dir)
+    cold_start_stats, load_tests = load_results(results_dir)
 
-    print(f"  Cold start data: {len(cold_starts)} runtimes")
+    print(f"  Cold start data: {len(cold_start_stats)} runtimes")
     print(f"  Load test data: {len(load_tests)} runtimes")
 
     # Generate report
     print("Generating comparison report...")
-    report = generate_markdown_report(results_dir, cold_starts, load_tests)
+    report = generate_markdown_report(results_dir, cold_start_stats, load_tests)
 
     # Save report
     output_file = results_dir / "comparison-report.md"
@@ -0,0 +1,123 @@
+import importlib.util
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import benchmark_io  # noqa: E402
+
+# The third python row has the blank cold_start cell measure-cold-starts.sh writes
+# when the probe response was empty
+COLD_STARTS_CSV = """runtime,iteration,cold_start,duration_ms,memory_used_mb,timestamp
+python,1,true,400,50,t
+python,2,false,120,50,t
+python,3,,310,50,t
+python,4,TRUE,500,60,t
+go,1,true,90,20,t
+"""
+
+
+def load_script(name):
+    """Import one of the hyphenated analysis scripts as a module"""
+    path = SCRIPTS_DIR / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(name.replace("-", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def results_dir(tmp_path):
+    (tmp_path / "cold-starts.csv").write_text(COLD_STARTS_CSV)
+    return tmp_path
+
+
+def test_blank_cold_start_cell_counts_as_warm(results_dir):
+    cold_starts = benchmark_io.load_cold_start_data(results_dir)
+
+    assert cold_starts["python"]["cold_start"].tolist() == [True, False, False, True]
+
+
+def test_cold_start_stats_skip_blank_cells(results_dir):
+    compare = load_script("compare-results")
+    cold_starts = benchmark_io.load_cold_start_data(results_dir)
+
+    stats = compare.calculate_cold_start_stats(cold_starts["python"])
+
+    assert stats["count"] == 2
+    assert stats["min_duration"] == 400
+    assert stats["max_duration"] == 500
+    assert stats["avg_memory"] == 55
+
+
+def test_chart_metrics_skip_blank_cells(results_dir):
+    visualize = load_script("visualize-results")
+    cold_starts = benchmark_io.load_cold_start_data(results_dir)
+
+    summary = visualize.aggregate_all(cold_starts, {})
+
+    assert summary.loc["python", "cold_avg"] == 450
+    assert summary.loc["python", "memory_avg"] == 55
+
+
+def test_streamed_stats_skip_blank_cells(results_dir):
+    compare = load_script("compare-results")
+
+    stats = compare.stream_cold_start_stats(results_dir / "cold-starts.csv")
+
+    assert stats["python"]["count"] == 2
+    assert stats["python"]["avg_duration"] == 450
+    assert stats["go"]["count"] == 1
+
+
+def test_cache_is_reparsed_when_format_changes(results_dir, monkeypatch):
+    benchmark_io.load(results_dir)
+    stale = {"python": "stale frame"}
+    with open(results_dir / benchmark_io.CACHE_FILE, "r+b") as f:
+        pickle.load(f)
+        pickle.dump((stale, {}), f)
+
+    assert benchmark_io.load(results_dir)[0] == stale
+
+    monkeypatch.setattr(benchmark_io, "CACHE_FORMAT", benchmark_io.CACHE_FORMAT + 1)
+    cold_starts, _ = benchmark_io.load(results_dir)
+    assert cold_starts["python"]["cold_start"].tolist() == [True, False, False, True]
+
+
+def test_streamed_percentiles_track_exact_ones():
+    np = pytest.importorskip("numpy")
+    compare = load_script("compare-results")
+    # Whole-millisecond samples, a few past the 10 s histogram range
+    samples = np.concatenate([np.arange(90, 2000, 7), [12_000, 15_500, 30_000]])
+    durations = samples.astype(np.float32)
+
+    stats = compare.ColdStartStats()
+    for batch in np.array_split(durations, 4):
+        stats.update(batch, np.zeros_like(batch))
+
+    # measure-cold-starts.sh records whole milliseconds, which the buckets reproduce exactly
+    for q in (50, 95, 99, 100):
+        assert stats.percentile(q) == pytest.approx(np.percentile(durations, q))
+
+    jittered = durations + np.float32(0.25)
+    stats = compare.ColdStartStats()
+    stats.update(jittered, np.zeros_like(jittered))
+    for q in (50, 95, 99):
+        assert abs(stats.percentile(q) - np.percentile(jittered, q)) <= 1
+
+
+def test_streamed_stats_match_whole_file_for_warm_only_runtime(tmp_path):
+    compare = load_script("compare-results")
+    (tmp_path / "cold-starts.csv").write_text(
+        COLD_STARTS_CSV + "node,1,false,80,30,t\nnode,2,,85,30,t\n"
+    )
+    cold_starts = benchmark_io.load_cold_start_data(tmp_path)
+
+    streamed = compare.stream_cold_start_stats(tmp_path / "cold-starts.csv")
+
+    assert streamed["node"] == compare.calculate_cold_start_stats(cold_starts["node"])
+    assert streamed["node"]["count"] == 0
@@ -2,25 +2,29 @@
 
 """
 Visualize benchmark results with charts and graphs.
-Requires: matplotlib, numpy
-Install: pip install matplotlib numpy
+Requires: matplotlib, numpy, pandas
+Install: pip install matplotlib numpy pandas
 """
 
-import json
+import argparse
+import multiprocessing
+import os
 import sys
-import csv
 from pathlib import Path
-from typing import Dict, List
-from collections import defaultdict
+from typing import Dict
 
 try:
     import matplotlib.pyplot as plt
     import matplotlib
     matplotlib.use('Agg')  # Non-interactive backend
     import numpy as np
-except ImportError:
-    print("Error: matplotlib is required")
-    print("Install with: pip install matplotlib numpy")
+    import pandas as pd
+    from benchmark_io import RUNTIMES, load
+except ImportError as e:
+    print(f"Error: {e}")
+    # benchmark_io lives next to this script; only third-party packages need installing
+    if e.name != "benchmark_io":
+        print("Install with: pip install matplotlib numpy pandas")
     sys.exit(1)
 
 
@@ -32,125 +36,114 @@ RUNTIME_COLORS = {
     'kotlin': '#7f52ff'       # Kotlin purple
 }
 
+# Output resolution; 150 DPI is sharp on screen at a quarter of the pixels of 300
+CHART_DPI = int(os.environ.get('CHART_DPI', 150))
 
-def load_cold_start_data(results_dir: Path) -> Dict[str, List[Dict]]:
-    """Load cold start measurements from CSV."""
-    cold_start_file = results_dir / "cold-starts.csv"
+# Plot order with its tick labels and colors, built once and masked per chart
+RUNTIME_ORDER = tuple(RUNTIMES)
+LABELS = np.array([runtime.capitalize() for runtime in RUNTIME_ORDER])
+COLORS = np.array([RUNTIME_COLORS[runtime] for runtime in RUNTIME_ORDER])
 
-    if not cold_start_file.exists():
-        return {}
+LATENCY_PERCENTILES = {'p50': 'p(50)', 'p90': 'p(90)', 'p95': 'p(95)', 'p99': 'p(99)'}
 
-    data = defaultdict(list)
+# Every column a chart reads; NaN means the runtime has no data for that metric
+SUMMARY_COLUMNS = [
+    'label', 'color', 'cold_avg', 'cold_p95', 'memory_avg', 'has_load_test',
+    'rps', 'error_rate', 'failed_rate', *LATENCY_PERCENTILES,
+]
 
-    with open(cold_start_file, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            runtime = row['runtime']
-            data[runtime].append({
-                'iteration': int(row['iteration']),
-                'cold_start': row['cold_start'].lower() == 'true',
-                'duration_ms': float(row['duration_ms']),
-                'memory_used_mb': float(row['memory_used_mb'])
-            })
 
-    return dict(data)
+def aggregate_all(cold_starts: Dict, load_tests: Dict) -> pd.DataFrame:
+    """Reduce the raw results to one row per runtime holding every plotted metric."""
+    rows = {}
 
+    for runtime in RUNTIME_ORDER:
+        row = {}
 
-def load_load_test_data(results_dir: Path) -> Dict[str, Dict]:
-    """Load k6 load test results from JSON."""
-    data = {}
-
-    for runtime in ['python', 'typescript', 'go', 'kotlin']:
-        load_test_file = results_dir / f"load-test-{runtime}.json"
+        if runtime in cold_starts:
+            # Typed column buffers, masked directly; no per-row Python objects or Series copies
+            data = cold_starts[runtime]
+            cold_mask = data['cold_start'].to_numpy(dtype=bool)
+            durations = data['duration_ms'].to_numpy()[cold_mask]
+            memories = data['memory_used_mb'].to_numpy()[cold_mask]
+            memories = memories[memories > 0]
+            if durations.size:
+                row['cold_avg'] = durations.mean()
+                row['cold_p95'] = np.percentile(durations, 95)
+            if memories.size:
+                row['memory_avg'] = memories.mean()
 
-        if not load_test_file.exists():
-            continue
+        if runtime in load_tests:
+            metrics = load_tests[runtime].get('metrics', {})
+            row['has_load_test'] = True
+            if 'http_req_duration' in metrics:
+                values = metrics['http_req_duration']['values']
+                row.update({col: values.get(key, 0) for col, key in LATENCY_PERCENTILES.items()})
+            if 'http_reqs' in metrics:
+                row['rps'] = metrics['http_reqs']['values'].get('rate', 0)
+            if 'errors' in metrics:
+                row['error_rate'] = metrics['errors']['values'].get('rate', 0) * 100
+            if 'http_req_failed' in metrics:
+                row['failed_rate'] = metrics['http_req_failed']['values'].get('rate', 0) * 100
 
-        with open(load_test_file, 'r') as f:
-            data[runtime] = json.load(f)
+        if row:
+            rows[runtime] = row
 
-    return data
+    summary = pd.DataFrame.from_dict(rows, orient='index')
+    summary = summary.reindex(index=RUNTIME_ORDER, columns=SUMMARY_COLUMNS)
+    summary['label'] = LABELS
+    summary['color'] = COLORS
+    return summary[summary.index.isin(rows)]
 
 
-def plot_cold_start_comparison(cold_starts: Dict, output_file: Path):
+def plot_cold_start_comparison(summary: pd.DataFrame, output_file: Path):
     """Create bar chart comparing cold start times."""
-    runtimes = []
-    avg_durations = []
-    p95_durations = []
-    colors = []
+    df = summary.dropna(subset=['cold_avg'])
 
-    for runtime in ['python', 'typescript', 'go', 'kotlin']:
-        if runtime not in cold_starts:
-            continue
-
-        cold_start_data = [d for d in cold_starts[runtime] if d['cold_start']]
-
-        if not cold_start_data:
-            continue
-
-        durations = [cs['duration_ms'] for cs in cold_start_data]
-        runtimes.append(runtime.capitalize())
-        avg_durations.append(np.mean(durations))
-        p95_durations.append(np.percentile(durations, 95))
-        colors.append(RUNTIME_COLORS.get(runtime, '#888888'))
-
-    if not runtimes:
+    if df.empty:
         print("No cold start data to plot")
         return
 
     fig, ax = plt.subplots(figsize=(10, 6))
 
-    x = np.arange(len(runtimes))
+    x = np.arange(len(df))
     width = 0.35
 
-    bars1 = ax.bar(x - width/2, avg_durations, width, label='Average', color=colors, alpha=0.8)
-    bars2 = ax.bar(x + width/2, p95_durations, width, label='P95', color=colors, alpha=0.5)
+    bars1 = ax.bar(x - width/2, df['cold_avg'], width, label='Average',
+                   color=df['color'], alpha=0.8)
+    bars2 = ax.bar(x + width/2, df['cold_p95'], width, label='P95', color=df['color'], alpha=0.5)
 
     ax.set_xlabel('Runtime', fontsize=12, fontweight='bold')
     ax.set_ylabel('Duration (ms)', fontsize=12, fontweight='bold')
     ax.set_title('Cold Start Performance Comparison', fontsize=14, fontweight='bold')
     ax.set_xticks(x)
-    ax.set_xticklabels(runtimes)
+    ax.set_xticklabels(df['label'])
     ax.legend()
     ax.grid(axis='y', alpha=0.3)
 
     # Add value labels on bars
     for bars in [bars1, bars2]:
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{height:.0f}',
-                   ha='center', va='bottom', fontsize=9)
+        ax.bar_label(bars, fmt='%.0f', fontsize=9)
 
     plt.tight_layout()
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    plt.savefig(output_file, dpi=CHART_DPI, bbox_inches='tight')
     plt.close()
 
     print(f"✓ Cold start comparison saved to: {output_file}")
 
 
-def plot_latency_percentiles(load_tests: Dict, output_file: Path):
+def plot_latency_percentiles(summary: pd.DataFrame, output_file: Path):
     """Create line chart showing latency percentiles."""
     fig, ax = plt.subplots(figsize=(12, 6))
 
-    percentiles = ['p(50)', 'p(90)', 'p(95)', 'p(99)']
     percentile_labels = ['P50', 'P90', 'P95', 'P99']
+    df = summary.dropna(subset=['p50'])
 
-    for runtime in ['python', 'typescript', 'go', 'kotlin']:
-        if runtime not in load_tests:
-            continue
-
-        metrics = load_tests[runtime].get('metrics', {})
-        if 'http_req_duration' not in metrics:
-            continue
-
-        values = metrics['http_req_duration']['values']
-        latencies = [values.get(p, 0) for p in percentiles]
-
-        ax.plot(percentile_labels, latencies,
+    for row in df.itertuples():
+        ax.plot(percentile_labels, [row.p50, row.p90, row.p95, row.p99],
                marker='o', linewidth=2, markersize=8,
-               label=runtime.capitalize(),
-               color=RUNTIME_COLORS.get(runtime, '#888888'))
+               label=row.label,
+               color=row.color)
 
     ax.set_xlabel('Percentile', fontsize=12, fontweight='bold')
     ax.set_ylabel('Latency (ms)', fontsize=12, fontweight='bold')
@@ -159,38 +152,23 @@ def plot_latency_percentiles(load_tests: Dict, output_file: Path):
     ax.grid(True, alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    plt.savefig(output_file, dpi=CHART_DPI, bbox_inches='tight')
     plt.close()
 
     print(f"✓ Latency percentiles saved to: {output_file}")
 
 
-def plot_throughput_comparison(load_tests: Dict, output_file: Path):
+def plot_throughput_comparison(summary: pd.DataFrame, output_file: Path):
     """Create bar chart comparing throughput."""
-    runtimes = []
-    requests_per_sec = []
-    colors = []
-
-    for runtime in ['python', 'typescript', 'go', 'kotlin']:
-        if runtime not in load_tests:
-            continue
+    df = summary.dropna(subset=['rps'])
 
-        metrics = load_tests[runtime].get('metrics', {})
-        if 'http_reqs' not in metrics:
-            continue
-
-        rps = metrics['http_reqs']['values'].get('rate', 0)
-        runtimes.append(runtime.capitalize())
-        requests_per_sec.append(rps)
-        colors.append(RUNTIME_COLORS.get(runtime, '#888888'))
-
-    if not runtimes:
+    if df.empty:
         print("No throughput data to plot")
         return
 
     fig, ax = plt.subplots(figsize=(10, 6))
 
-    bars = ax.bar(runtimes, requests_per_sec, color=colors, alpha=0.8)
+    bars = ax.bar(df['label'], df['rps'], color=df['color'], alpha=0.8)
 
     ax.set_xlabel('Runtime', fontsize=12, fontweight='bold')
     ax.set_ylabel('Requests per Second', fontsize=12, fontweight='bold')
@@ -198,100 +176,60 @@ def plot_throughput_comparison(load_tests: Dict, output_file: Path):
     ax.grid(axis='y', alpha=0.3)
 
     # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-               f'{height:.1f}',
-               ha='center', va='bottom', fontsize=10)
+    ax.bar_label(bars, fmt='%.1f', fontsize=10)
 
     plt.tight_layout()
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    plt.savefig(output_file, dpi=CHART_DPI, bbox_inches='tight')
     plt.close()
 
     print(f"✓ Throughput comparison saved to: {output_file}")
 
 
-def plot_error_rates(load_tests: Dict, output_file: Path):
+def plot_error_rates(summary: pd.DataFrame, output_file: Path):
     """Create bar chart comparing error rates."""
-    runtimes = []
-    error_rates = []
-    failed_rates = []
-    colors = []
-
-    for runtime in ['python', 'typescript', 'go', 'kotlin']:
-        if runtime not in load_tests:
-            continue
-
-        metrics = load_tests[runtime].get('metrics', {})
-
-        error_rate = 0
-        failed_rate = 0
-
-        if 'errors' in metrics:
-            error_rate = metrics['errors']['values'].get('rate', 0) * 100
-
-        if 'http_req_failed' in metrics:
-            failed_rate = metrics['http_req_failed']['values'].get('rate', 0) * 100
-
-        runtimes.append(runtime.capitalize())
-        error_rates.append(error_rate)
-        failed_rates.append(failed_rate)
-        colors.append(RUNTIME_COLORS.get(runtime, '#888888'))
+    # Every load-tested runtime gets bars; a missing rate metric plots as 0
+    df = summary[summary['has_load_test'].notna()]
 
-    if not runtimes:
+    if df.empty:
         print("No error rate data to plot")
         return
 
     fig, ax = plt.subplots(figsize=(10, 6))
 
-    x = np.arange(len(runtimes))
+    x = np.arange(len(df))
     width = 0.35
 
-    ax.bar(x - width/2, error_rates, width, label='Error Rate', color=colors, alpha=0.8)
-    ax.bar(x + width/2, failed_rates, width, label='Failed Requests', color=colors, alpha=0.5)
+    ax.bar(x - width/2, df['error_rate'].fillna(0), width, label='Error Rate',
+           color=df['color'], alpha=0.8)
+    ax.bar(x + width/2, df['failed_rate'].fillna(0), width, label='Failed Requests',
+           color=df['color'], alpha=0.5)
 
     ax.set_xlabel('Runtime', fontsize=12, fontweight='bold')
     ax.set_ylabel('Rate (%)', fontsize=12, fontweight='bold')
     ax.set_title('Error Rates Comparison', fontsize=14, fontweight='bold')
     ax.set_xticks(x)
-    ax.set_xticklabels(runtimes)
+    ax.set_xticklabels(df['label'])
     ax.legend()
     ax.grid(axis='y', alpha=0.3)
 
     plt.tight_layout()
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    plt.savefig(output_file, dpi=CHART_DPI, bbox_inches='tight')
     plt.close()
 
     print(f"✓ Error rates saved to: {output_file}")
 
 
-def plot_memory_usage(cold_starts: Dict, output_file: Path):
+def plot_memory_usage(summary: pd.DataFrame, output_file: Path):
     """Create bar chart comparing memory usage during cold starts."""
-    runtimes = []
-    avg_memory = []
-    colors = []
+    df = summary.dropna(subset=['memory_avg'])
 
-    for runtime in ['python', 'typescript', 'go', 'kotlin']:
-        if runtime not in cold_starts:
-            continue
-
-        cold_start_data = [d for d in cold_starts[runtime] if d['cold_start'] and d['memory_used_mb'] > 0]
-
-        if not cold_start_data:
-            continue
-
-        memories = [cs['memory_used_mb'] for cs in cold_start_data]
-        runtimes.append(runtime.capitalize())
-        avg_memory.append(np.mean(memories))
-        colors.append(RUNTIME_COLORS.get(runtime, '#888888'))
-
-    if not runtimes:
+    if df.empty:
         print("No memory usage data to plot")
         return
 
     fig, ax = plt.subplots(figsize=(10, 6))
 
-    bars = ax.bar(runtimes, avg_memory, color=colors, alpha=0.8)
+    bars = ax.bar(df['label'], df['memory_avg'], color=df['color'], alpha=0.8)
 
     ax.set_xlabel('Runtime', fontsize=12, fontweight='bold')
     ax.set_ylabel('Memory (MB)', fontsize=12, fontweight='bold')
@@ -299,141 +237,47 @@ def plot_memory_usage(cold_starts: Dict, output_file: Path):
     ax.grid(axis='y', alpha=0.3)
 
     # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-               f'{height:.1f}',
-               ha='center', va='bottom', fontsize=10)
+    ax.bar_label(bars, fmt='%.1f', fontsize=10)
 
     plt.tight_layout()
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    plt.savefig(output_file, dpi=CHART_DPI, bbox_inches='tight')
     plt.close()
 
     print(f"✓ Memory usage saved to: {output_file}")
 
 
-def create_summary_dashboard(cold_starts: Dict, load_tests: Dict, output_file: Path):
+def _dashboard_bars(ax, summary: pd.DataFrame, column: str, title: str, ylabel: str):
+    """Draw one dashboard bar panel from a pre-aggregated summary column."""
+    df = summary.dropna(subset=[column])
+
+    if df.empty:
+        return
+
+    ax.bar(df['label'], df[column], color=df['color'], alpha=0.8)
+    ax.set_title(title, fontweight='bold')
+    ax.set_ylabel(ylabel)
+    ax.grid(axis='y', alpha=0.3)
+
+
+def create_summary_dashboard(summary: pd.DataFrame, output_file: Path):
     """Create a comprehensive dashboard with multiple charts."""
     fig = plt.figure(figsize=(16, 10))
     gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.3)
 
-    # 1. Cold Start Comparison
-    ax1 = fig.add_subplot(gs[0, 0])
-    runtimes = []
-    avg_durations = []
-    colors = []
+    _dashboard_bars(fig.add_subplot(gs[0, 0]), summary, 'cold_avg',
+                    'Cold Start (Avg)', 'Duration (ms)')
+    _dashboard_bars(fig.add_subplot(gs[0, 1]), summary, 'p95', 'P95 Latency', 'Latency (ms)')
+    _dashboard_bars(fig.add_subplot(gs[1, 0]), summary, 'rps', 'Throughput', 'Requests/sec')
+    _dashboard_bars(fig.add_subplot(gs[1, 1]), summary, 'error_rate', 'Error Rate', 'Rate (%)')
+    _dashboard_bars(fig.add_subplot(gs[2, 0]), summary, 'memory_avg',
+                    'Memory Usage (Cold Start)', 'Memory (MB)')
 
-    for runtime in ['python', 'typescript', 'go', 'kotlin']:
-        if runtime in cold_starts:
-            cold_start_data = [d for d in cold_starts[runtime] if d['cold_start']]
-            if cold_start_data:
-                durations = [cs['duration_ms'] for cs in cold_start_data]
-                runtimes.append(runtime.capitalize())
-                avg_durations.append(np.mean(durations))
-                colors.append(RUNTIME_COLORS.get(runtime, '#888888'))
-
-    if runtimes:
-        ax1.bar(runtimes, avg_durations, color=colors, alpha=0.8)
-        ax1.set_title('Cold Start (Avg)', fontweight='bold')
-        ax1.set_ylabel('Duration (ms)')
-        ax1.grid(axis='y', alpha=0.3)
-
-    # 2. Latency P95
-    ax2 = fig.add_subplot(gs[0, 1])
-    runtimes = []
-    p95_latencies = []
-    colors = []
-
-    for runtime in ['python', 'typescript', 'go', 'kotlin']:
-        if runtime in load_tests:
-            metrics = load_tests[runtime].get('metrics', {})
-            if 'http_req_duration' in metrics:
-                p95 = metrics['http_req_duration']['values'].get('p(95)', 0)
-                runtimes.append(runtime.capitalize())
-                p95_latencies.append(p95)
-                colors.append(RUNTIME_COLORS.get(runtime, '#888888'))
-
-    if runtimes:
-        ax2.bar(runtimes, p95_latencies, color=colors, alpha=0.8)
-        ax2.set_title('P95 Latency', fontweight='bold')
-        ax2.set_ylabel('Latency (ms)')
-        ax2.grid(axis='y', alpha=0.3)
-
-    # 3. Throughput
-    ax3 = fig.add_subplot(gs[1, 0])
-    runtimes = []
-    requests_per_sec = []
-    colors = []
-
-    for runtime in ['python', 'typescript', 'go', 'kotlin']:
-        if runtime in load_tests:
-            metrics = load_tests[runtime].get('metrics', {})
-            if 'http_reqs' in metrics:
-                rps = metrics['http_reqs']['values'].get('rate', 0)
-                runtimes.append(runtime.capitalize())
-                requests_per_sec.append(rps)
-                colors.append(RUNTIME_COLORS.get(runtime, '#888888'))
-
-    if runtimes:
-        ax3.bar(runtimes, requests_per_sec, color=colors, alpha=0.8)
-        ax3.set_title('Throughput', fontweight='bold')
-        ax3.set_ylabel('Requests/sec')
-        ax3.grid(axis='y', alpha=0.3)
-
-    # 4. Error Rates
-    ax4 = fig.add_subplot(gs[1, 1])
-    runtimes = []
-    error_rates = []
-    colors = []
-
-    for runtime in ['python', 'typescript', 'go', 'kotlin']:
-        if runtime in load_tests:
-            metrics = load_tests[runtime].get('metrics', {})
-            if 'errors' in metrics:
-                error_rate = metrics['errors']['values'].get('rate', 0) * 100
-                runtimes.append(runtime.capitalize())
-                error_rates.append(error_rate)
-                colors.append(RUNTIME_COLORS.get(runtime, '#888888'))
-
-    if runtimes:
-        ax4.bar(runtimes, error_rates, color=colors, alpha=0.8)
-        ax4.set_title('Error Rate', fontweight='bold')
-        ax4.set_ylabel('Rate (%)')
-        ax4.grid(axis='y', alpha=0.3)
-
-    # 5. Memory Usage
-    ax5 = fig.add_subplot(gs[2, 0])
-    runtimes = []
-    avg_memory = []
-    colors = []
-
-    for runtime in ['python', 'typescript', 'go', 'kotlin']:
-        if runtime in cold_starts:
-            cold_start_data = [d for d in cold_starts[runtime] if d['cold_start'] and d['memory_used_mb'] > 0]
-            if cold_start_data:
-                memories = [cs['memory_used_mb'] for cs in cold_start_data]
-                runtimes.append(runtime.capitalize())
-                avg_memory.append(np.mean(memories))
-                colors.append(RUNTIME_COLORS.get(runtime, '#888888'))
-
-    if runtimes:
-        ax5.bar(runtimes, avg_memory, color=colors, alpha=0.8)
-        ax5.set_title('Memory Usage (Cold Start)', fontweight='bold')
-        ax5.set_ylabel('Memory (MB)')
-        ax5.grid(axis='y', alpha=0.3)
-
-    # 6. Latency Distribution
+    # Latency Distribution
     ax6 = fig.add_subplot(gs[2, 1])
-    for runtime in ['python', 'typescript', 'go', 'kotlin']:
-        if runtime in load_tests:
-            metrics = load_tests[runtime].get('metrics', {})
-            if 'http_req_duration' in metrics:
-                values = metrics['http_req_duration']['values']
-                percentiles = ['p(50)', 'p(95)', 'p(99)']
-                latencies = [values.get(p, 0) for p in percentiles]
-                ax6.plot(['P50', 'P95', 'P99'], latencies,
-                        marker='o', label=runtime.capitalize(),
-                        color=RUNTIME_COLORS.get(runtime, '#888888'))
+    for row in summary.dropna(subset=['p50']).itertuples():
+        ax6.plot(['P50', 'P95', 'P99'], [row.p50, row.p95, row.p99],
+                marker='o', label=row.label,
+                color=row.color)
 
     ax6.set_title('Latency Percentiles', fontweight='bold')
     ax6.set_ylabel('Latency (ms)')
@@ -443,18 +287,45 @@ def create_summary_dashboard(cold_starts: Dict, load_tests: Dict, output_file: P
     fig.suptitle('Multi-Runtime API Benchmark - Summary Dashboard',
                 fontsize=16, fontweight='bold')
 
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    plt.savefig(output_file, dpi=CHART_DPI, bbox_inches='tight')
     plt.close()
 
     print(f"✓ Summary dashboard saved to: {output_file}")
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python visualize-results.py <results_directory>")
-        sys.exit(1)
+def _render_one(plot, summary: pd.DataFrame, output_file: Path):
+    """Pool entry point; a module-level function so it can be sent to the workers."""
+    plot(summary, output_file)
+
 
-    results_dir = Path(sys.argv[1])
+def render_charts(jobs):
+    """Render (plot, summary, output_file) jobs, one process per chart where fork is available."""
+    workers = min(len(jobs), os.cpu_count() or 1)
+
+    # Agg rasterizing and PNG encoding are CPU-bound, so charts only overlap across processes
+    if workers < 2 or 'fork' not in multiprocessing.get_all_start_methods():
+        for job in jobs:
+            _render_one(*job)
+        return
+
+    with multiprocessing.get_context('fork').Pool(workers) as pool:
+        pool.starmap(_render_one, jobs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Visualize benchmark results.")
+    parser.add_argument('results_dir', type=Path,
+                        help="directory holding cold-starts.csv and load-test-*.json")
+    parser.add_argument(
+        '--charts', default='dashboard', choices=['dashboard', 'individual', 'both'],
+        help="dashboard shows one headline metric per panel; the individual charts add "
+             "cold start P95, P90 latency, failed requests and value labels (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    results_dir = args.results_dir
+    individual = args.charts in ('individual', 'both')
+    dashboard = args.charts in ('dashboard', 'both')
 
     if not results_dir.exists():
         print(f"Error: Results directory not found: {results_dir}")
@@ -463,27 +334,33 @@ def main():
     print("Loading benchmark results...")
 
     # Load data
-    cold_starts = load_cold_start_data(results_dir)
-    load_tests = load_load_test_data(results_dir)
+    cold_starts, load_tests = load(results_dir)
 
     print(f"  Cold start data: {len(cold_starts)} runtimes")
     print(f"  Load test data: {len(load_tests)} runtimes")
 
     print("\nGenerating visualizations...")
 
-    # Create individual charts
-    if cold_starts:
-        plot_cold_start_comparison(cold_starts, results_dir / "chart-cold-start.png")
-        plot_memory_usage(cold_starts, results_dir / "chart-memory.png")
+    # Aggregate once; every chart reads from this table
+    summary = aggregate_all(cold_starts, load_tests)
+
+    jobs = []
+
+    # Individual charts
+    if individual and cold_starts:
+        jobs.append((plot_cold_start_comparison, summary, results_dir / "chart-cold-start.png"))
+        jobs.append((plot_memory_usage, summary, results_dir / "chart-memory.png"))
+
+    if individual and load_tests:
+        jobs.append((plot_latency_percentiles, summary, results_dir / "chart-latency.png"))
+        jobs.append((plot_throughput_comparison, summary, results_dir / "chart-throughput.png"))
+        jobs.append((plot_error_rates, summary, results_dir / "chart-errors.png"))
 
-    if load_tests:
-        plot_latency_percentiles(load_tests, results_dir / "chart-latency.png")
-        plot_throughput_comparison(load_tests, results_dir / "chart-throughput.png")
-        plot_error_rates(load_tests, results_dir / "chart-errors.png")
+    # Summary dashboard
+    if dashboard and (cold_starts or load_tests):
+        jobs.append((create_summary_dashboard, summary, results_dir / "dashboard.png"))
 
-    # Create summary dashboard
-    if cold_starts or load_tests:
-        create_summary_dashboard(cold_starts, load_tests, results_dir / "dashboard.png")
+    render_charts(jobs)
 
     print("\n✓ All visualizations generated successfully!")
 
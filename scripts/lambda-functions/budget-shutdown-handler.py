@@ -3,60 +3,244 @@ AWS Budget Shutdown Handler Lambda Function
 Automatically stops AWS resources when budget thresholds are exceeded
 """
 
+import bisect
 import boto3
+from botocore.config import Config
 import json
 import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# AWS Clients, created on first use and reused by warm invocations, so a
+# warning-level alert only pays for the SNS client
+_clients = {}
+_clients_lock = threading.Lock()
+
+# One session shares credential resolution and loaded service models across all clients
+_session = boto3.session.Session()
+
+# Pool sized for the concurrent stop/tag fan-outs (urllib3 defaults to 10 connections).
+# botocore always sets TCP_NODELAY; tcp_keepalive adds SO_KEEPALIVE so pooled
+# connections idle between warm invocations are not silently dropped.
+# Adaptive retries rate-limit the client when a fan-out gets throttled instead of
+# retrying every call on a fixed schedule
+_client_config = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+def _log_retries(parsed=None, model=None, **kwargs):
+    """Record calls that needed retries (usually throttling) for post-mortems"""
+    metadata = (parsed or {}).get('ResponseMetadata', {})
+    if metadata.get('RetryAttempts'):
+        logger.warning(
+            f"{model.name} succeeded after {metadata['RetryAttempts']} retries "
+            f"(request {metadata.get('RequestId')})"
+        )
+
+_session.events.register('after-call', _log_retries)
+
+def get_client(service_name: str):
+    """Return the container-wide boto3 client for a service, creating it once"""
+    client = _clients.get(service_name)
+    if client is None:
+        # Sessions are not thread-safe, and stop_* calls run in worker threads
+        with _clients_lock:
+            client = _clients.get(service_name)
+            if client is None:
+                client = _session.client(service_name, config=_client_config)
+                _clients[service_name] = client
+    return client
+
+def _chunks(items: List, size: int):
+    """Yield consecutive slices of at most size items"""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+# Configuration from environment variables
+SNS_TOPIC_ARN = os.environ.get('SNS_TOPIC_ARN')
+SHUTDOWN_DISABLED = os.environ.get('SHUTDOWN_DISABLED', 'false').lower() == 'true'
+ESSENTIAL_TAG_KEY = os.environ.get('ESSENTIAL_TAG_KEY', 'Essential')
+ESSENTIAL_TAG_VALUE = os.environ.get('ESSENTIAL_TAG_VALUE', 'true')
+
+# Essential-tag lookups are reused by warm invocations for up to this long
+ESSENTIAL_CACHE_SECONDS = 60
+
+def _cache_window() -> int:
+    """Changes every ESSENTIAL_CACHE_SECONDS; passed to the cached lookups as a TTL key"""
+    return int(time.monotonic() // ESSENTIAL_CACHE_SECONDS)
+
+# The lookups raise on API errors so that failures are never cached
+
+@lru_cache(maxsize=1024)
+def essential_ec2_instance_ids(tag_key: str, tag_value: str, window: int) -> frozenset:
+    """IDs of running EC2 instances tagged as essential"""
+    pages = get_client('ec2').get_paginator('describe_instances').paginate(
+        Filters=[
+            {'Name': 'instance-state-name', 'Values': ['running']},
+            {'Name': f'tag:{tag_key}', 'Values': [tag_value]}
+        ]
+    )
+    return frozenset(
+        instance['InstanceId']
+        for page in pages
+        for reservation in page['Reservations']
+        for instance in reservation['Instances']
+    )
+
+@lru_cache(maxsize=1024)
+def essential_ecs_services(cluster_arn: str, service_arns: tuple, tag_key: str, tag_value: str,
+                           window: int) -> frozenset:
+    """ARNs of the given services (at most 10, one DescribeServices call) tagged as essential"""
+    response = get_client('ecs').describe_services(
+        cluster=cluster_arn,
+        services=list(service_arns),
+        include=['TAGS']
+    )
+    return frozenset(
+        service['serviceArn']
+        for service in response['services']
+        for tag in service.get('tags', [])
+        if tag['key'] == tag_key and tag['value'] == tag_value
+    )
+
+def warm_clients() -> None:
+    """Build the clients and open their connections ahead of the first alert"""
+    # Read-only calls the handler already has permission for; each resolves
+    # credentials and completes DNS and the TLS handshake for its endpoint
+    warmups = {
+        'ec2': lambda ec2: ec2.describe_instances(MaxResults=5),
+        'rds': lambda rds: rds.describe_db_instances(MaxRecords=20),
+        'ecs': lambda ecs: ecs.list_clusters(maxResults=1),
+        'sns': None,
+    }
+    for service_name, call in warmups.items():
+        try:
+            client = get_client(service_name)
+            if call:
+                call(client)
+        except Exception as e:
+            logger.warning(f"Client warmup failed for {service_name}: {e}")
+
+# Provisioned-concurrency environments run this module's init ahead of any invocation,
+# so the warmup cost stays off the alert path there; on-demand cold starts skip it
+if os.environ.get('AWS_LAMBDA_INITIALIZATION_TYPE') == 'provisioned-concurrency':
+    warm_clients()
+
+# Notification bodies per budget tier
+_WARNING_MESSAGE = (
+    "⚠️ BUDGET WARNING: {name} reached {pct:.1f}%\n"
+    "Consider reviewing resource usage to avoid exceeding limits."
+)
+_CRITICAL_MESSAGE = (
+    "🔴 BUDGET CRITICAL: {name} reached {pct:.1f}%\n\n"
+    "Non-essential services have been stopped:\n"
+    "{bullets}\n\n"
+    "Essential services remain running."
+)
+_EMERGENCY_MESSAGE = (
+    "🚨 EMERGENCY SHUTDOWN: {name} exceeded 100%\n\n"
+    "ALL services have been stopped to prevent further costs:\n"
+    "{bullets}\n\n"
+    "Manual intervention required to restart services."
+)
+
+def _bullets(actions: List[str]) -> str:
+    """Render actions as a bulleted list, one per line"""
+    return "\n".join(f"• {action}" for action in actions)
+
 class BudgetShutdownHandler:
     def __init__(self):
-        """Initialize AWS service clients"""
-        self.ec2 = boto3.client('ec2')
-        self.rds = boto3.client('rds')
-        self.ecs = boto3.client('ecs')
-        self.lambda_client = boto3.client('lambda')
-        self.sns = boto3.client('sns')
-        
-        # Configuration from environment variables
-        import os
-        self.sns_topic_arn = os.environ.get('SNS_TOPIC_ARN')
-        self.shutdown_disabled = os.environ.get('SHUTDOWN_DISABLED', 'false').lower() == 'true'
-        self.essential_tag_key = os.environ.get('ESSENTIAL_TAG_KEY', 'Essential')
-        self.essential_tag_value = os.environ.get('ESSENTIAL_TAG_VALUE', 'true')
+        """Bind the configuration; AWS clients are resolved lazily by the properties below"""
+        self.sns_topic_arn = SNS_TOPIC_ARN
+        self.shutdown_disabled = SHUTDOWN_DISABLED
+        self.essential_tag_key = ESSENTIAL_TAG_KEY
+        self.essential_tag_value = ESSENTIAL_TAG_VALUE
+        self._essential_pair = (self.essential_tag_key, self.essential_tag_value)
         
         # Thresholds
         self.WARNING_THRESHOLD = 50.0
         self.CRITICAL_THRESHOLD = 80.0
         self.EMERGENCY_THRESHOLD = 100.0
+        
+        # Sorted tier floors and their handlers; below the lowest floor nothing is done
+        self._tier_floors = [
+            self.WARNING_THRESHOLD, self.CRITICAL_THRESHOLD, self.EMERGENCY_THRESHOLD
+        ]
+        self._tier_handlers = [self._handle_warning, self._handle_critical, self._handle_emergency]
+        
+        # Concurrent per-resource API calls (ECS service updates, RDS stops)
+        self.MAX_PARALLEL_CALLS = 16
+        self.EC2_STOP_BATCH_SIZE = 1000
+    
+    @property
+    def ec2(self):
+        return get_client('ec2')
+    
+    @property
+    def rds(self):
+        return get_client('rds')
+    
+    @property
+    def ecs(self):
+        return get_client('ecs')
+    
+    @property
+    def lambda_client(self):
+        return get_client('lambda')
+    
+    @property
+    def sns(self):
+        return get_client('sns')
     
     def stop_ecs_services(self, essential_only: bool = False) -> List[str]:
         """Stop ECS services"""
         actions = []
         
         try:
-            clusters = self.ecs.list_clusters()['clusterArns']
+            clusters = [
+                cluster_arn
+                for page in self.ecs.get_paginator('list_clusters').paginate()
+                for cluster_arn in page['clusterArns']
+            ]
+            
+            list_services = self.ecs.get_paginator('list_services')
+            services = []
             
             for cluster_arn in clusters:
-                services = self.ecs.list_services(cluster=cluster_arn)['serviceArns']
-                
-                for service_arn in services:
-                    service_name = service_arn.split('/')[-1]
-                    
-                    # Check if service is tagged as essential
-                    if essential_only and self._is_ecs_service_essential(cluster_arn, service_arn):
-                        continue
-                    
-                    self.ecs.update_service(
-                        cluster=cluster_arn,
-                        service=service_arn,
-                        desiredCount=0
+                service_arns = [
+                    service_arn
+                    for page in list_services.paginate(
+                        cluster=cluster_arn, PaginationConfig={'PageSize': 100}
                     )
-                    actions.append(f"Stopped ECS service: {service_name}")
+                    for service_arn in page['serviceArns']
+                ]
+                
+                # Skip services tagged as essential
+                essential = (
+                    self._essential_ecs_services(cluster_arn, service_arns)
+                    if essential_only else set()
+                )
+                services.extend(
+                    (cluster_arn, service_arn)
+                    for service_arn in service_arns
+                    if service_arn not in essential
+                )
+            
+            # One blocking round-trip per service, so issue them concurrently
+            with ThreadPoolExecutor(max_workers=self.MAX_PARALLEL_CALLS) as executor:
+                actions.extend(executor.map(lambda pair: self._stop_ecs_service(*pair), services))
                     
         except Exception as e:
             actions.append(f"ECS stop error: {str(e)}")
@@ -64,44 +248,56 @@ class BudgetShutdownHandler:
         
         return actions
     
+    def _stop_ecs_service(self, cluster_arn: str, service_arn: str) -> str:
+        """Scale one ECS service to zero, returning the action taken"""
+        service_name = service_arn.split('/')[-1]
+        
+        try:
+            self.ecs.update_service(
+                cluster=cluster_arn,
+                service=service_arn,
+                desiredCount=0
+            )
+            return f"Stopped ECS service: {service_name}"
+        except Exception as stop_error:
+            # Report per service; raising would make executor.map drop the services already stopped
+            logger.error(f"Error stopping ECS service {service_name}: {stop_error}")
+            return f"Could not stop ECS service {service_name}: {stop_error}"
+    
     def stop_ec2_instances(self, essential_only: bool = False) -> List[str]:
         """Stop EC2 instances"""
         actions = []
         
         try:
             # Get running instances
+            instances_to_stop = self._running_instance_ids()
+            
             if essential_only:
-                # Only stop non-essential instances
-                reservations = self.ec2.describe_instances(
-                    Filters=[
-                        {'Name': 'instance-state-name', 'Values': ['running']}
-                    ]
-                )['Reservations']
-                
-                instances_to_stop = []
-                for reservation in reservations:
-                    for instance in reservation['Instances']:
-                        if not self._is_instance_essential(instance):
-                            instances_to_stop.append(instance['InstanceId'])
-            else:
-                # Stop all running instances
-                reservations = self.ec2.describe_instances(
-                    Filters=[
-                        {'Name': 'instance-state-name', 'Values': ['running']}
-                    ]
-                )['Reservations']
-                
-                instances_to_stop = []
-                for reservation in reservations:
-                    for instance in reservation['Instances']:
-                        instances_to_stop.append(instance['InstanceId'])
+                # Only stop non-essential instances; EC2 filters the essential tag server-side
+                essential = essential_ec2_instance_ids(
+                    self.essential_tag_key, self.essential_tag_value, _cache_window()
+                )
+                instances_to_stop = [i for i in instances_to_stop if i not in essential]
             
             # Stop instances
             if instances_to_stop:
-                self.ec2.stop_instances(InstanceIds=instances_to_stop)
-                for instance_id in instances_to_stop:
-                    action_type = "EMERGENCY STOP" if not essential_only else "Stopped"
-                    actions.append(f"{action_type} - EC2: {instance_id}")
+                # StopInstances accepts at most 1000 IDs per request
+                batches = _chunks(instances_to_stop, self.EC2_STOP_BATCH_SIZE)
+                action_type = "EMERGENCY STOP" if not essential_only else "Stopped"
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    futures = [
+                        (ids, executor.submit(self.ec2.stop_instances, InstanceIds=ids))
+                        for ids in batches
+                    ]
+                # Check each batch on its own so one failure keeps the others in the report
+                for ids, future in futures:
+                    try:
+                        future.result()
+                    except Exception as stop_error:
+                        logger.error(f"Error stopping {len(ids)} EC2 instances: {stop_error}")
+                        actions.append(f"Could not stop EC2 {', '.join(ids)}: {stop_error}")
+                        continue
+                    actions.extend(f"{action_type} - EC2: {instance_id}" for instance_id in ids)
                     
         except Exception as e:
             actions.append(f"EC2 stop error: {str(e)}")
@@ -114,22 +310,19 @@ class BudgetShutdownHandler:
         actions = []
         
         try:
-            instances = self.rds.describe_db_instances()['DBInstances']
+            # DescribeDBInstances returns each instance's TagList, so status and
+            # essential tag come from the same paginated call with no tag lookups
+            available = [
+                instance['DBInstanceIdentifier']
+                for page in self.rds.get_paginator('describe_db_instances').paginate()
+                for instance in page['DBInstances']
+                if instance['DBInstanceStatus'] == 'available'
+                and not self._has_essential_tag(instance.get('TagList', ()))
+            ]
             
-            for instance in instances:
-                if instance['DBInstanceStatus'] == 'available':
-                    # Check if instance is tagged as essential
-                    if self._is_rds_instance_essential(instance['DBInstanceIdentifier']):
-                        continue
-                    
-                    try:
-                        self.rds.stop_db_instance(
-                            DBInstanceIdentifier=instance['DBInstanceIdentifier']
-                        )
-                        actions.append(f"Stopped RDS instance: {instance['DBInstanceIdentifier']}")
-                    except Exception as stop_error:
-                        # Some RDS instances can't be stopped (e.g., Multi-AZ)
-                        actions.append(f"Could not stop RDS {instance['DBInstanceIdentifier']}: {stop_error}")
+            # Stops are independent per instance, so run them concurrently
+            with ThreadPoolExecutor(max_workers=self.MAX_PARALLEL_CALLS) as executor:
+                actions.extend(executor.map(self._stop_rds_instance, available))
                         
         except Exception as e:
             actions.append(f"RDS stop error: {str(e)}")
@@ -137,46 +330,59 @@ class BudgetShutdownHandler:
         
         return actions
     
-    def _is_instance_essential(self, instance: Dict) -> bool:
-        """Check if EC2 instance is tagged as essential"""
-        tags = instance.get('Tags', [])
-        for tag in tags:
-            if (tag['Key'] == self.essential_tag_key and 
-                tag['Value'] == self.essential_tag_value):
-                return True
-        return False
-    
-    def _is_rds_instance_essential(self, db_identifier: str) -> bool:
-        """Check if RDS instance is tagged as essential"""
+    def _stop_rds_instance(self, db_identifier: str) -> str:
+        """Stop one RDS instance, returning the action taken"""
         try:
-            response = self.rds.list_tags_for_resource(
-                ResourceName=f"arn:aws:rds:*:*:db:{db_identifier}"
-            )
-            
-            tags = response.get('TagList', [])
-            for tag in tags:
-                if (tag['Key'] == self.essential_tag_key and 
-                    tag['Value'] == self.essential_tag_value):
-                    return True
-        except Exception:
-            pass  # If can't check tags, assume not essential
+            self.rds.stop_db_instance(DBInstanceIdentifier=db_identifier)
+            return f"Stopped RDS instance: {db_identifier}"
+        except Exception as stop_error:
+            # Some RDS instances can't be stopped (e.g., Multi-AZ)
+            return f"Could not stop RDS {db_identifier}: {stop_error}"
+    
+    def _running_instance_ids(self) -> List[str]:
+        """IDs of all running EC2 instances"""
+        pages = self.ec2.get_paginator('describe_instances').paginate(
+            Filters=[
+                {'Name': 'instance-state-name', 'Values': ['running']}
+            ]
+        )
         
-        return False
+        # Follow every page; a truncated listing would leave instances running
+        return [
+            instance['InstanceId']
+            for page in pages
+            for reservation in page['Reservations']
+            for instance in reservation['Instances']
+        ]
     
-    def _is_ecs_service_essential(self, cluster_arn: str, service_arn: str) -> bool:
-        """Check if ECS service is tagged as essential"""
-        try:
-            response = self.ecs.list_tags_for_resource(resourceArn=service_arn)
-            
-            tags = response.get('tags', [])
-            for tag in tags:
-                if (tag['key'] == self.essential_tag_key and 
-                    tag['value'] == self.essential_tag_value):
-                    return True
-        except Exception:
-            pass  # If can't check tags, assume not essential
+    def _has_essential_tag(self, tags: List[Dict]) -> bool:
+        """Check if an EC2/RDS-style tag list marks the resource as essential"""
+        return any((tag['Key'], tag['Value']) == self._essential_pair for tag in tags)
+    
+    def _essential_ecs_services(self, cluster_arn: str, service_arns: List[str]) -> set:
+        """ARNs of the cluster's services tagged as essential"""
+        essential = set()
+        window = _cache_window()
+        
+        # DescribeServices returns tags for up to 10 services per call
+        for chunk in _chunks(service_arns, 10):
+            try:
+                essential |= essential_ecs_services(
+                    cluster_arn, tuple(chunk),
+                    self.essential_tag_key, self.essential_tag_value, window
+                )
+            except Exception:
+                continue  # If can't check tags, assume not essential
         
-        return False
+        return essential
+    
+    def _run_concurrently(self, *calls) -> List[str]:
+        """Run independent stop_* calls in parallel and merge their actions in call order"""
+        # boto3 clients are thread-safe and each stop_* call handles its own errors,
+        # so one failing service never drops the actions of the others
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = [executor.submit(fn, **kwargs) for fn, kwargs in calls]
+            return [action for future in futures for action in future.result()]
     
     def send_notification(self, message: str, subject: str) -> None:
         """Send SNS notification"""
@@ -194,6 +400,46 @@ class BudgetShutdownHandler:
         except Exception as e:
             logger.error(f"Failed to send SNS notification: {e}")
     
+    def _handle_warning(
+        self, budget_name: str, threshold_percentage: float
+    ) -> Tuple[List[str], Tuple[str, str]]:
+        """Level 1: Warning (50-80%)"""
+        message = _WARNING_MESSAGE.format(name=budget_name, pct=threshold_percentage)
+        return ["Warning notification sent"], (message, f"Budget Warning - {budget_name}")
+    
+    def _handle_critical(
+        self, budget_name: str, threshold_percentage: float
+    ) -> Tuple[List[str], Tuple[str, str]]:
+        """Level 2: Critical (80-100%) - Stop non-essential resources"""
+        logger.warning(f"CRITICAL: Budget {budget_name} at {threshold_percentage}% - stopping non-essential resources")
+        
+        # Stop non-essential ECS services and EC2 instances in parallel
+        actions_taken = self._run_concurrently(
+            (self.stop_ecs_services, {'essential_only': True}),
+            (self.stop_ec2_instances, {'essential_only': True}),
+        )
+        
+        message = _CRITICAL_MESSAGE.format(
+            name=budget_name, pct=threshold_percentage, bullets=_bullets(actions_taken)
+        )
+        return actions_taken, (message, f"Budget Critical - Services Stopped - {budget_name}")
+    
+    def _handle_emergency(
+        self, budget_name: str, threshold_percentage: float
+    ) -> Tuple[List[str], Tuple[str, str]]:
+        """Level 3: Emergency (≥100%) - Stop all resources"""
+        logger.error(f"EMERGENCY: Budget {budget_name} exceeded 100% - stopping all resources")
+        
+        # Stop all EC2 instances, RDS instances and ECS services in parallel
+        actions_taken = self._run_concurrently(
+            (self.stop_ec2_instances, {'essential_only': False}),
+            (self.stop_rds_instances, {}),
+            (self.stop_ecs_services, {'essential_only': False}),
+        )
+        
+        message = _EMERGENCY_MESSAGE.format(name=budget_name, bullets=_bullets(actions_taken))
+        return actions_taken, (message, f"EMERGENCY SHUTDOWN - {budget_name}")
+    
     def process_budget_alert(self, budget_name: str, alert_type: str, 
                            threshold_percentage: float) -> Dict[str, Any]:
         """Process budget alert and take appropriate action"""
@@ -213,61 +459,22 @@ class BudgetShutdownHandler:
             }
         
         actions_taken = []
+        # (message, subject) published once, after the result is built
+        notification = None
         
         try:
-            # Level 1: Warning (50-80%)
-            if self.WARNING_THRESHOLD <= threshold_percentage < self.CRITICAL_THRESHOLD:
-                message = f"⚠️ BUDGET WARNING: {budget_name} reached {threshold_percentage:.1f}%\n"
-                message += "Consider reviewing resource usage to avoid exceeding limits."
-                
-                self.send_notification(message, f"Budget Warning - {budget_name}")
-                actions_taken.append("Warning notification sent")
-            
-            # Level 2: Critical (80-100%) - Stop non-essential resources
-            elif self.CRITICAL_THRESHOLD <= threshold_percentage < self.EMERGENCY_THRESHOLD:
-                logger.warning(f"CRITICAL: Budget {budget_name} at {threshold_percentage}% - stopping non-essential resources")
-                
-                # Stop non-essential ECS services
-                ecs_actions = self.stop_ecs_services(essential_only=True)
-                actions_taken.extend(ecs_actions)
-                
-                # Stop non-essential EC2 instances
-                ec2_actions = self.stop_ec2_instances(essential_only=True)
-                actions_taken.extend(ec2_actions)
-                
-                message = f"🔴 BUDGET CRITICAL: {budget_name} reached {threshold_percentage:.1f}%\n\n"
-                message += "Non-essential services have been stopped:\n"
-                message += "\n".join([f"• {action}" for action in actions_taken])
-                message += "\n\nEssential services remain running."
-                
-                self.send_notification(message, f"Budget Critical - Services Stopped - {budget_name}")
-            
-            # Level 3: Emergency (≥100%) - Stop all resources
-            elif threshold_percentage >= self.EMERGENCY_THRESHOLD:
-                logger.error(f"EMERGENCY: Budget {budget_name} exceeded 100% - stopping all resources")
-                
-                # Stop all EC2 instances
-                all_ec2_actions = self.stop_ec2_instances(essential_only=False)
-                actions_taken.extend(all_ec2_actions)
-                
-                # Stop all RDS instances
-                rds_actions = self.stop_rds_instances()
-                actions_taken.extend(rds_actions)
-                
-                # Stop all ECS services
-                all_ecs_actions = self.stop_ecs_services(essential_only=False)
-                actions_taken.extend(all_ecs_actions)
-                
-                message = f"🚨 EMERGENCY SHUTDOWN: {budget_name} exceeded 100%\n\n"
-                message += "ALL services have been stopped to prevent further costs:\n"
-                message += "\n".join([f"• {action}" for action in actions_taken])
-                message += "\n\nManual intervention required to restart services."
-                
-                self.send_notification(message, f"EMERGENCY SHUTDOWN - {budget_name}")
+            # NaN compares false with every floor and would otherwise bisect to the top tier
+            if math.isnan(threshold_percentage):
+                tier = -1
+            else:
+                tier = bisect.bisect_right(self._tier_floors, threshold_percentage) - 1
+            if tier >= 0:
+                handler = self._tier_handlers[tier]
+                actions_taken, notification = handler(budget_name, threshold_percentage)
             
             logger.info(f"Actions completed: {actions_taken}")
             
-            return {
+            result = {
                 'statusCode': 200,
                 'body': {
                     'message': f'Budget alert processed for {budget_name}',
@@ -281,14 +488,13 @@ class BudgetShutdownHandler:
         except Exception as e:
             logger.error(f"Error processing budget alert: {str(e)}")
             
-            # Send error notification
+            # Error notification replaces any tier notification
             error_message = f"❌ ERROR: Budget shutdown function failed for {budget_name}\n"
             error_message += f"Error: {str(e)}\n"
             error_message += "Manual intervention required."
+            notification = (error_message, "Budget Function Error")
             
-            self.send_notification(error_message, "Budget Function Error")
-            
-            return {
+            result = {
                 'statusCode': 500,
                 'body': {
                     'error': str(e),
@@ -296,6 +502,12 @@ class BudgetShutdownHandler:
                     'timestamp': datetime.utcnow().isoformat()
                 }
             }
+        
+        # The shutdown is done by now; the single SNS round-trip is the last step
+        if notification:
+            self.send_notification(*notification)
+        
+        return result
 
 def lambda_handler(event, context):
     """
@@ -309,7 +521,9 @@ def lambda_handler(event, context):
     }
     """
     
-    logger.info(f"Received event: {json.dumps(event)}")
+    # Serialize the full payload only when debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", json.dumps(event, separators=(',', ':')))
     
     # Extract budget information from event
     budget_name = event.get('budgetName', 'Unknown')
@@ -320,7 +534,9 @@ def lambda_handler(event, context):
     handler = BudgetShutdownHandler()
     result = handler.process_budget_alert(budget_name, alert_type, threshold_percentage)
     
-    logger.info(f"Processing completed with result: {result}")
+    logger.info("Processing completed with status %s", result['statusCode'])
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Result: %s", json.dumps(result, separators=(',', ':'), default=str))
     
     return result
 
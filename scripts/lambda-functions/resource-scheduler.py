@@ -8,6 +8,8 @@ import json
 import boto3
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
 from datetime import datetime, timezone, time
 from typing import Dict, List, Any, Optional
 
@@ -15,10 +17,19 @@ from typing import Dict, List, Any, Optional
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# AWS Clients
-ec2_client = boto3.client('ec2')
-rds_client = boto3.client('rds')
-sns_client = boto3.client('sns')
+# AWS Clients, created once per container from a shared session so warm invocations
+# reuse the loaded service models and pooled connections.
+# Pool sized for the concurrent RDS tag lookups (urllib3 defaults to 10 connections);
+# adaptive retries back off client-side when the account gets throttled
+_session = boto3.session.Session()
+_client_config = Config(
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+ec2_client = _session.client('ec2', config=_client_config)
+rds_client = _session.client('rds', config=_client_config)
+sns_client = _session.client('sns', config=_client_config)
 
 # Configuration from environment variables
 SCHEDULER_TAG_KEY = os.environ.get('SCHEDULER_TAG_KEY', 'AutoSchedule')
@@ -26,6 +37,16 @@ SNS_TOPIC_ARN = os.environ.get('SNS_TOPIC_ARN')
 DRY_RUN = os.environ.get('DRY_RUN', 'false').lower() == 'true'
 TIMEZONE_OFFSET = int(os.environ.get('TIMEZONE_OFFSET', '0'))  # Hours offset from UTC
 
+# Instance IDs per StartInstances/StopInstances call
+EC2_BATCH_SIZE = 200
+
+# Concurrent RDS tag lookups
+RDS_TAG_WORKERS = 16
+
+def _tag_dict(tags: Optional[List[Dict]]) -> Dict[str, str]:
+    """Index an EC2 or RDS tag list (both are [{'Key', 'Value'}]) by key"""
+    return {tag.get('Key'): tag.get('Value') for tag in tags or ()}
+
 class ResourceScheduler:
     """Manages scheduled starting and stopping of AWS resources"""
     
@@ -34,6 +55,13 @@ class ResourceScheduler:
         self.errors = []
         self.current_time = datetime.now(timezone.utc)
         
+        # The clock is fixed for the invocation, so each distinct schedule tag is
+        # evaluated once and every further instance with it is a dict lookup
+        self._current_day = self.current_time.strftime('%a')  # Mon, Tue, etc.
+        self._current_day_idx = self.current_time.weekday()
+        self._current_time = self.current_time.time()
+        self._decision_cache: Dict[str, str] = {}
+        
         # Predefined schedules (24-hour format)
         self.schedules = {
             'business-hours': {'days': 'Mon-Fri', 'start': '08:00', 'stop': '18:00'},
@@ -48,9 +76,16 @@ class ResourceScheduler:
         try:
             logger.info("Starting Resource Scheduler execution")
             
-            # Process all scheduled resources
-            ec2_results = self.schedule_ec2_instances()
-            rds_results = self.schedule_rds_instances()
+            # The EC2 and RDS phases are independent, so overlap their API round-trips.
+            # Each phase collects its own actions and errors, merged here in a fixed order
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                ec2_future = pool.submit(self.schedule_ec2_instances)
+                rds_future = pool.submit(self.schedule_rds_instances)
+                ec2_results = ec2_future.result()
+                rds_results = rds_future.result()
+            
+            self.actions_taken = ec2_results['actions'] + rds_results['actions']
+            self.errors = ec2_results['errors'] + rds_results['errors']
             
             results = {
                 'statusCode': 200,
@@ -74,26 +109,29 @@ class ResourceScheduler:
             return results
             
         except Exception as e:
-            logger.error(f"Resource Scheduler execution failed: {str(e)}")
+            logger.error("Resource Scheduler execution failed: %s", e)
             return {
                 'statusCode': 500,
                 'error': str(e),
                 'timestamp': self.current_time.isoformat()
             }
     
-    def schedule_ec2_instances(self) -> Dict[str, int]:
+    def schedule_ec2_instances(self) -> Dict[str, Any]:
         """Process scheduled EC2 instances"""
-        results = {'processed': 0, 'started': 0, 'stopped': 0}
+        results = {'processed': 0, 'started': 0, 'stopped': 0, 'actions': [], 'errors': []}
+        to_start = []
+        to_stop = []
         
         try:
-            # Get all instances with the scheduler tag
-            response = ec2_client.describe_instances(
+            # Get all instances with the scheduler tag, one page at a time
+            pages = ec2_client.get_paginator('describe_instances').paginate(
                 Filters=[
                     {'Name': f'tag:{SCHEDULER_TAG_KEY}', 'Values': ['*']}
-                ]
+                ],
+                PaginationConfig={'PageSize': 1000}
             )
             
-            for reservation in response['Reservations']:
+            for reservation in (r for page in pages for r in page['Reservations']):
                 for instance in reservation['Instances']:
                     try:
                         instance_id = instance['InstanceId']
@@ -106,7 +144,8 @@ class ResourceScheduler:
                         results['processed'] += 1
                         
                         # Get schedule from tags
-                        schedule_value = self.get_tag_value(instance.get('Tags', []), SCHEDULER_TAG_KEY)
+                        tag_map = _tag_dict(instance.get('Tags'))
+                        schedule_value = tag_map.get(SCHEDULER_TAG_KEY)
                         if not schedule_value:
                             continue
                         
@@ -114,70 +153,102 @@ class ResourceScheduler:
                         desired_action = self.get_desired_action(schedule_value)
                         
                         if desired_action == 'start' and current_state == 'stopped':
-                            if not DRY_RUN:
-                                ec2_client.start_instances(InstanceIds=[instance_id])
-                            
-                            self.actions_taken.append(f"Started EC2 instance: {instance_id}")
-                            results['started'] += 1
-                            logger.info(f"Started EC2 instance {instance_id}")
+                            to_start.append(instance_id)
                             
                         elif desired_action == 'stop' and current_state == 'running':
                             # Check for protection tag
-                            if self.is_protected(instance.get('Tags', [])):
-                                logger.info(f"EC2 instance {instance_id} is protected from stopping")
+                            if (tag_map.get('DoNotShutdown') or '').lower() == 'true':
+                                logger.info("EC2 instance %s is protected from stopping", instance_id)
                                 continue
                             
-                            if not DRY_RUN:
-                                ec2_client.stop_instances(InstanceIds=[instance_id])
-                            
-                            self.actions_taken.append(f"Stopped EC2 instance: {instance_id}")
-                            results['stopped'] += 1
-                            logger.info(f"Stopped EC2 instance {instance_id}")
+                            to_stop.append(instance_id)
                     
                     except Exception as e:
                         error_msg = f"Error processing EC2 instance {instance_id}: {str(e)}"
                         logger.error(error_msg)
-                        self.errors.append(error_msg)
+                        results['errors'].append(error_msg)
         
         except Exception as e:
             error_msg = f"Error listing EC2 instances: {str(e)}"
             logger.error(error_msg)
-            self.errors.append(error_msg)
+            results['errors'].append(error_msg)
+        
+        # One call per batch instead of one per instance. Outside the listing try so
+        # instances collected before a listing failure are still acted on;
+        # apply_ec2_action records failures per ID and never raises
+        results['started'] = self.apply_ec2_action(ec2_client.start_instances, to_start, 'Started', results)
+        results['stopped'] = self.apply_ec2_action(ec2_client.stop_instances, to_stop, 'Stopped', results)
         
         return results
     
-    def schedule_rds_instances(self) -> Dict[str, int]:
+    def apply_ec2_action(self, action, instance_ids: List[str], verb: str, results: Dict[str, Any]) -> int:
+        """Start or stop EC2 instances in batches, retrying a rejected batch one ID at a time"""
+        done = []
+        
+        for i in range(0, len(instance_ids), EC2_BATCH_SIZE):
+            batch = instance_ids[i:i + EC2_BATCH_SIZE]
+            try:
+                if not DRY_RUN:
+                    action(InstanceIds=batch)
+                done.extend(batch)
+            except Exception as e:
+                # One bad ID fails the whole call, and a connection error or timeout
+                # may be transient, so retry each ID on its own
+                logger.warning("EC2 batch call for %d instances failed, retrying individually: %s", len(batch), e)
+                for instance_id in batch:
+                    try:
+                        action(InstanceIds=[instance_id])
+                        done.append(instance_id)
+                    except Exception as e:
+                        error_msg = f"Error processing EC2 instance {instance_id}: {str(e)}"
+                        logger.error(error_msg)
+                        results['errors'].append(error_msg)
+        
+        for instance_id in done:
+            results['actions'].append(f"{verb} EC2 instance: {instance_id}")
+            logger.info("%s EC2 instance %s", verb, instance_id)
+        
+        return len(done)
+    
+    def schedule_rds_instances(self) -> Dict[str, Any]:
         """Process scheduled RDS instances"""
-        results = {'processed': 0, 'started': 0, 'stopped': 0}
+        results = {'processed': 0, 'started': 0, 'stopped': 0, 'actions': [], 'errors': []}
         
         try:
-            # Get all RDS instances
-            response = rds_client.describe_db_instances()
+            # Get all RDS instances, one page at a time
+            pages = rds_client.get_paginator('describe_db_instances').paginate()
+            candidates = []
+            
+            for instance in (i for page in pages for i in page['DBInstances']):
+                # Skip instances that can't be stopped/started
+                if instance.get('MultiAZ', False):
+                    logger.info("Skipping Multi-AZ RDS instance %s", instance['DBInstanceIdentifier'])
+                    continue
+                
+                results['processed'] += 1
+                candidates.append(instance)
             
-            for instance in response['DBInstances']:
+            # Tags come inline with the listing; look up only the ones that are missing,
+            # concurrently since they are independent round-trips
+            tag_lists = [instance.get('TagList') for instance in candidates]
+            missing = [i for i, tags in enumerate(tag_lists) if tags is None]
+            if missing:
+                with ThreadPoolExecutor(max_workers=RDS_TAG_WORKERS) as pool:
+                    fetched = pool.map(self.get_rds_tags, (candidates[i] for i in missing))
+                    for i, tags in zip(missing, fetched):
+                        tag_lists[i] = tags
+            
+            for instance, tags in zip(candidates, tag_lists):
                 try:
                     db_identifier = instance['DBInstanceIdentifier']
                     current_state = instance['DBInstanceStatus']
                     
-                    # Skip instances that can't be stopped/started
-                    if instance.get('MultiAZ', False):
-                        logger.info(f"Skipping Multi-AZ RDS instance {db_identifier}")
-                        continue
-                    
-                    results['processed'] += 1
-                    
-                    # Get tags for this RDS instance
-                    try:
-                        tags_response = rds_client.list_tags_for_resource(
-                            ResourceName=instance['DBInstanceArn']
-                        )
-                        tags = tags_response.get('TagList', [])
-                    except Exception as e:
-                        logger.warning(f"Could not get tags for RDS instance {db_identifier}: {e}")
+                    if tags is None:
                         continue
                     
                     # Get schedule from tags
-                    schedule_value = self.get_tag_value_rds(tags, SCHEDULER_TAG_KEY)
+                    tag_map = _tag_dict(tags)
+                    schedule_value = tag_map.get(SCHEDULER_TAG_KEY)
                     if not schedule_value:
                         continue
                     
@@ -188,61 +259,54 @@ class ResourceScheduler:
                         if not DRY_RUN:
                             rds_client.start_db_instance(DBInstanceIdentifier=db_identifier)
                         
-                        self.actions_taken.append(f"Started RDS instance: {db_identifier}")
+                        results['actions'].append(f"Started RDS instance: {db_identifier}")
                         results['started'] += 1
-                        logger.info(f"Started RDS instance {db_identifier}")
+                        logger.info("Started RDS instance %s", db_identifier)
                         
                     elif desired_action == 'stop' and current_state == 'available':
                         # Check for protection tag
-                        if self.is_protected_rds(tags):
-                            logger.info(f"RDS instance {db_identifier} is protected from stopping")
+                        if (tag_map.get('DoNotShutdown') or '').lower() == 'true':
+                            logger.info("RDS instance %s is protected from stopping", db_identifier)
                             continue
                         
                         if not DRY_RUN:
                             rds_client.stop_db_instance(DBInstanceIdentifier=db_identifier)
                         
-                        self.actions_taken.append(f"Stopped RDS instance: {db_identifier}")
+                        results['actions'].append(f"Stopped RDS instance: {db_identifier}")
                         results['stopped'] += 1
-                        logger.info(f"Stopped RDS instance {db_identifier}")
+                        logger.info("Stopped RDS instance %s", db_identifier)
                 
                 except Exception as e:
                     error_msg = f"Error processing RDS instance {db_identifier}: {str(e)}"
                     logger.error(error_msg)
-                    self.errors.append(error_msg)
+                    results['errors'].append(error_msg)
         
         except Exception as e:
             error_msg = f"Error listing RDS instances: {str(e)}"
             logger.error(error_msg)
-            self.errors.append(error_msg)
+            results['errors'].append(error_msg)
         
         return results
     
-    def get_tag_value(self, tags: List[Dict], key: str) -> Optional[str]:
-        """Get tag value from EC2 tag list"""
-        for tag in tags:
-            if tag.get('Key') == key:
-                return tag.get('Value')
-        return None
-    
-    def get_tag_value_rds(self, tags: List[Dict], key: str) -> Optional[str]:
-        """Get tag value from RDS tag list"""
-        for tag in tags:
-            if tag.get('Key') == key:
-                return tag.get('Value')
-        return None
-    
-    def is_protected(self, tags: List[Dict]) -> bool:
-        """Check if EC2 resource is protected from stopping"""
-        protection_value = self.get_tag_value(tags, 'DoNotShutdown')
-        return protection_value and protection_value.lower() == 'true'
-    
-    def is_protected_rds(self, tags: List[Dict]) -> bool:
-        """Check if RDS resource is protected from stopping"""
-        protection_value = self.get_tag_value_rds(tags, 'DoNotShutdown')
-        return protection_value and protection_value.lower() == 'true'
+    def get_rds_tags(self, instance: Dict) -> Optional[List[Dict]]:
+        """Fetch tags for an RDS instance, or None if they could not be read"""
+        try:
+            return rds_client.list_tags_for_resource(
+                ResourceName=instance['DBInstanceArn']
+            ).get('TagList', [])
+        except Exception as e:
+            logger.warning("Could not get tags for RDS instance %s: %s", instance['DBInstanceIdentifier'], e)
+            return None
     
     def get_desired_action(self, schedule_value: str) -> str:
         """Determine if resource should be started or stopped based on schedule"""
+        action = self._decision_cache.get(schedule_value)
+        if action is None:
+            action = self._decision_cache[schedule_value] = self._evaluate_action(schedule_value)
+        return action
+    
+    def _evaluate_action(self, schedule_value: str) -> str:
+        """Parse a schedule tag value and evaluate it against the current time"""
         # Handle special cases
         if schedule_value == '24x7':
             return 'start'
@@ -271,21 +335,17 @@ class ResourceScheduler:
                 
                 return self.evaluate_schedule(schedule_config)
             except Exception as e:
-                logger.error(f"Error parsing custom schedule '{schedule_value}': {e}")
+                logger.error("Error parsing custom schedule '%s': %s", schedule_value, e)
                 return 'none'
         
-        logger.warning(f"Unknown schedule format: {schedule_value}")
+        logger.warning("Unknown schedule format: %s", schedule_value)
         return 'none'
     
     def evaluate_schedule(self, schedule_config: Dict[str, str]) -> str:
         """Evaluate if current time is within schedule"""
-        # Get current day and time
-        current_day = self.current_time.strftime('%a')  # Mon, Tue, etc.
-        current_time = self.current_time.time()
-        
         # Check if current day is in schedule
         days_range = schedule_config['days']
-        if not self.is_current_day_in_range(current_day, days_range):
+        if not self.is_current_day_in_range(days_range):
             return 'stop'
         
         # Parse start and stop times
@@ -303,107 +363,107 @@ class ResourceScheduler:
             stop_time = time.fromisoformat(stop_time_str)
             
             # Check if current time is within schedule
-            if start_time <= current_time <= stop_time:
+            if start_time <= self._current_time <= stop_time:
                 return 'start'
             else:
                 return 'stop'
                 
         except Exception as e:
-            logger.error(f"Error parsing schedule times: {e}")
+            logger.error("Error parsing schedule times: %s", e)
             return 'none'
     
-    def is_current_day_in_range(self, current_day: str, days_range: str) -> bool:
+    def is_current_day_in_range(self, days_range: str) -> bool:
         """Check if current day is within the specified range"""
-        days_map = {
-            'Mon': 0, 'Tue': 1, 'Wed': 2, 'Thu': 3,
-            'Fri': 4, 'Sat': 5, 'Sun': 6
-        }
-        
         if days_range == 'Mon-Sun':
             return True
         elif days_range == 'Mon-Fri':
-            return days_map[current_day] <= 4
+            return self._current_day_idx <= 4
         elif days_range == 'Sat-Sun':
-            return days_map[current_day] >= 5
+            return self._current_day_idx >= 5
         else:
             # Handle specific days like "Mon,Wed,Fri" or single day "Mon"
             if ',' in days_range:
                 allowed_days = [day.strip() for day in days_range.split(',')]
-                return current_day in allowed_days
+                return self._current_day in allowed_days
             else:
-                return current_day == days_range
+                return self._current_day == days_range
     
     def send_notification(self, results: Dict) -> None:
         """Send SNS notification with scheduling results"""
         try:
-            message = self.format_notification_message(results)
+            # One clock read for both the subject and the report footer
+            now = datetime.now(timezone.utc)
+            message = self.format_notification_message(results, now)
             
             sns_client.publish(
                 TopicArn=SNS_TOPIC_ARN,
                 Message=message,
-                Subject=f"AWS Resource Scheduler Report - {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+                Subject=f"AWS Resource Scheduler Report - {now.strftime('%Y-%m-%d %H:%M')}"
             )
             
             logger.info("Notification sent successfully")
             
         except Exception as e:
-            logger.error(f"Failed to send notification: {str(e)}")
+            logger.error("Failed to send notification: %s", e)
     
-    def format_notification_message(self, results: Dict) -> str:
+    def format_notification_message(self, results: Dict, now: Optional[datetime] = None) -> str:
         """Format notification message"""
         mode = "DRY RUN" if results['dry_run'] else "EXECUTION"
+        now = now or datetime.now(timezone.utc)
+        actions = results.get('actions_taken') or ['None']
+        errors = results.get('errors', [])
         
-        message = f"""
-AWS Resource Scheduler Report ({mode})
-=====================================
-
-⏰ Execution Time: {results['timestamp']}
-
-📊 SUMMARY:
-• EC2 Instances Processed: {results['ec2_processed']}
-• EC2 Instances Started: {results['ec2_started']}
-• EC2 Instances Stopped: {results['ec2_stopped']}
-• RDS Instances Processed: {results['rds_processed']}  
-• RDS Instances Started: {results['rds_started']}
-• RDS Instances Stopped: {results['rds_stopped']}
-
-🎯 ACTIONS TAKEN:
-"""
+        lines = [
+            "",
+            f"AWS Resource Scheduler Report ({mode})",
+            "=====================================",
+            "",
+            f"⏰ Execution Time: {results['timestamp']}",
+            "",
+            "📊 SUMMARY:",
+            f"• EC2 Instances Processed: {results['ec2_processed']}",
+            f"• EC2 Instances Started: {results['ec2_started']}",
+            f"• EC2 Instances Stopped: {results['ec2_stopped']}",
+            f"• RDS Instances Processed: {results['rds_processed']}",
+            f"• RDS Instances Started: {results['rds_started']}",
+            f"• RDS Instances Stopped: {results['rds_stopped']}",
+            "",
+            "🎯 ACTIONS TAKEN:",
+        ]
+        lines.extend(f"• {action}" for action in actions)
         
-        for action in results.get('actions_taken', []):
-            message += f"• {action}\n"
+        if errors:
+            lines.append("")
+            lines.append(f"❌ ERRORS ({len(errors)}):")
+            lines.extend(f"• {error}" for error in errors)
         
-        if results.get('errors'):
-            message += f"\n❌ ERRORS ({len(results['errors'])}):\n"
-            for error in results['errors']:
-                message += f"• {error}\n"
+        lines.extend([
+            "",
+            "💡 SCHEDULE TYPES:",
+            "• business-hours: Mon-Fri 08:00-18:00",
+            "• dev-hours: Mon-Fri 09:00-17:00",
+            "• demo-only: Manual control only",
+            "• 24x7: Always running",
+            "• never: Always stopped",
+            '• custom: Format like "Mon-Fri:09:00-17:00"',
+            "",
+            "🏷️ TAGGING:",
+            f'Tag resources with "{SCHEDULER_TAG_KEY}=<schedule>" to enable scheduling.',
+            'Add "DoNotShutdown=true" to protect critical resources.',
+            "",
+            f"Report Time: {now.strftime('%Y-%m-%d %H:%M:%S UTC')}",
+            "",
+        ])
         
-        message += f"""
-💡 SCHEDULE TYPES:
-• business-hours: Mon-Fri 08:00-18:00
-• dev-hours: Mon-Fri 09:00-17:00  
-• demo-only: Manual control only
-• 24x7: Always running
-• never: Always stopped
-• custom: Format like "Mon-Fri:09:00-17:00"
-
-🏷️ TAGGING:
-Tag resources with "{SCHEDULER_TAG_KEY}=<schedule>" to enable scheduling.
-Add "DoNotShutdown=true" to protect critical resources.
-
-Report Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
-"""
-        
-        return message
-
+        return "\n".join(lines)
 
-# Initialize scheduler
-scheduler = ResourceScheduler()
 
 # Lambda handler function (entry point)
 def lambda_handler(event, context):
     """Main Lambda entry point"""
-    return scheduler.lambda_handler(event, context)
+    # A fresh scheduler per invocation: a module-level one carried actions, errors
+    # and the evaluation time over into every warm invocation
+    return ResourceScheduler().lambda_handler(event, context)
 
 
 # For local testing